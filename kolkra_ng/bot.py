@@ -1,20 +1,27 @@
 import asyncio
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import ParamSpec, TypeVar
 
 from beanie import Document, init_beanie
-from discord import Intents, Interaction, Member, Message
+from discord import Guild, Intents, Interaction, Member, Message, Role
 from discord.ext import commands
 from discord.utils import Coro, sleep_until
 from motor.motor_asyncio import AsyncIOMotorClient
 
+from kolkra_ng.command_index import CommandIndex
+from kolkra_ng.command_sync import CommandTreeState, tree_hash
 from kolkra_ng.config import Config
 from kolkra_ng.context import KolkraContext
+from kolkra_ng.db_registry import registered_models
 from kolkra_ng.enums.staff_level import StaffLevel
-from kolkra_ng.help import KolkraHelp
+from kolkra_ng.help import HelpRenderCache, KolkraHelp
+from kolkra_ng.import_profiler import ImportProfiler
+from kolkra_ng.role_resolver import RoleResolver
 from kolkra_ng.webhooks import SupportsWebhooks, WebhookManager
 
 log = logging.getLogger(__name__)
@@ -26,25 +33,69 @@ ContextT = TypeVar("ContextT", bound=commands.Context)
 
 
 class Kolkra(commands.Bot):
-    def __init__(self, config: Config) -> None:
+    def __init__(
+        self,
+        config: Config,
+        *,
+        force_sync: bool = False,
+        import_profiler: ImportProfiler | None = None,
+    ) -> None:
         super().__init__(
             command_prefix=commands.when_mentioned_or(";"),
             intents=Intents.default()
             | Intents(members=True, message_content=True, presences=True),
         )
         self.config = config
+        self.force_sync = force_sync
+        self.import_profiler = import_profiler
         self.motor = AsyncIOMotorClient(
             self.config.mongodb_url.get_secret_value().unicode_string()
         )
         self.help_command = KolkraHelp()
         self.webhooks = WebhookManager(self)
+        self.role_resolver = RoleResolver(self)
         self.owner_ids = self.config.devs
+        # Highest level first, so lookups can stop at the first role a member has
+        self.staff_role_levels: dict[int, StaffLevel] = {
+            roles.permission_role: level
+            for level, roles in sorted(
+                self.config.staff_roles.items(), key=lambda i: i[0], reverse=True
+            )
+        }
+        self._staff_level_cache: dict[tuple[int, int], StaffLevel | None] = {}
+        self._command_index: CommandIndex | None = None
+        self.help_render_cache = HelpRenderCache()
+        self.created_at = time.perf_counter()
+        self.startup_timings: dict[str, float] = {}
+        self.lazy_load_task: asyncio.Task[None] | None = None
+        self._initialized_models: set[type[Document]] = set()
+        self._db_init: asyncio.Task[None] | None = None
+
+    async def init_db_models(self) -> None:
+        """Makes sure every registered document model is initialized.
 
-    async def init_db_models(self, *models: type[Document]) -> None:
+        Callers that come in while an initialization is already running (e.g. cogs being loaded side by side) share it
+        rather than starting their own, so normally all models are set up with one `init_beanie` call.
+        """
+        while any(m not in self._initialized_models for m in registered_models()):
+            if self._db_init is None:
+                self._db_init = asyncio.create_task(self._init_db_models())
+            task = self._db_init
+            try:
+                await asyncio.shield(task)
+            finally:
+                if task.done() and self._db_init is task:
+                    self._db_init = None
+
+    async def _init_db_models(self) -> None:
+        # By the time this task runs, every extension loaded in the same batch has been imported (and so registered its
+        # models), since none of them yields to the event loop before that.
+        models = [m for m in registered_models() if m not in self._initialized_models]
         log.info(
             "Setting up database models: %s",
             ", ".join(m.__qualname__ for m in models),
         )
+        start = time.perf_counter()
         await init_beanie(
             database=self.motor.get_database(
                 (self.config.mongodb_url.get_secret_value().path or "kolkra_ng").strip(
@@ -53,6 +104,31 @@ class Kolkra(commands.Bot):
             ),
             document_models=list(models),
         )
+        elapsed = time.perf_counter() - start
+        self._initialized_models.update(models)
+        self.startup_timings["database"] = (
+            self.startup_timings.get("database", 0) + elapsed
+        )
+        log.info("Set up %d database models in %.2fs", len(models), elapsed)
+
+    @property
+    def command_index(self) -> CommandIndex:
+        """An index of top-level command names/aliases, rebuilt after commands are added or removed (e.g. on extension reloads)."""
+        if self._command_index is None:
+            self._command_index = CommandIndex(self.all_commands)
+        return self._command_index
+
+    def invalidate_command_caches(self) -> None:
+        self._command_index = None
+        self.help_render_cache.clear()
+
+    def add_command(self, command: commands.Command, /) -> None:
+        super().add_command(command)
+        self.invalidate_command_caches()
+
+    def remove_command(self, name: str, /) -> commands.Command | None:
+        self.invalidate_command_caches()
+        return super().remove_command(name)
 
     async def update_attrs(self) -> None:
         self.guild = self.get_guild(self.config.guild) or await self.fetch_guild(
@@ -70,43 +146,83 @@ class Kolkra(commands.Bot):
         else:
             log.info("Configured log channel: %s", self.log_channel)
 
-    async def load_modules(self) -> None:
-        log.info("Loading modules")
+    def discover_modules(self) -> list[str]:
         pkg_root = Path(__file__).parent
-        for path in pkg_root.joinpath("cogs").iterdir():
-            if path.name.startswith("__"):
-                continue
-            module = (
-                path.relative_to(pkg_root)
-                .as_posix()
-                .removesuffix(".py")
-                .replace("/", ".")
-            )
-            try:
-                await self.load_extension(module)
-            except NotImplementedError:
-                log.info("Skipped unfinished module %s", module)
-            except Exception as e:
-                log.warning("Failed to load module %s", module, exc_info=e)
-            else:
-                log.info("Loaded module %s", module)
-        await self.load_extension("jishaku")
-        log.info("Loaded Jishaku (debug module)")
+        return [
+            path.relative_to(pkg_root).as_posix().removesuffix(".py").replace("/", ".")
+            for path in pkg_root.joinpath("cogs").iterdir()
+            if not path.name.startswith("__")
+        ]
+
+    async def load_module(self, module: str) -> None:
+        start = time.perf_counter()
+        try:
+            await self.load_extension(module)
+        except NotImplementedError:
+            log.info("Skipped unfinished module %s", module)
+        except Exception as e:
+            log.warning("Failed to load module %s", module, exc_info=e)
+        else:
+            log.info("Loaded module %s in %.2fs", module, time.perf_counter() - start)
+
+    async def load_modules(self, modules: list[str]) -> None:
+        # Extensions are independent of each other, so their (mostly I/O-bound) setup can overlap
+        log.info("Loading modules: %s", ", ".join(modules))
+        await asyncio.gather(*(self.load_module(module) for module in modules))
+
+    async def load_lazy_modules(self) -> None:
+        start = time.perf_counter()
+        await self.load_modules(self.config.lazy_modules)
+        await self.register_commands()
+        log.info("Loaded lazy modules in %.2fs", time.perf_counter() - start)
 
     async def register_commands(self) -> None:
-        log.info("Registering application (slash) commands")
         self.tree.copy_global_to(guild=self.guild)
+        payload_hash = tree_hash(self.tree, self.guild)
+        await self.init_db_models()
+        state = await CommandTreeState.find_one(
+            CommandTreeState.guild_id == self.guild.id
+        ) or CommandTreeState(guild_id=self.guild.id, payload_hash="")
+        if state.payload_hash == payload_hash and not self.force_sync:
+            log.info("Application (slash) commands unchanged, skipping sync")
+            return
+        log.info("Registering application (slash) commands")
         await self.tree.sync(guild=self.guild)
+        state.payload_hash = payload_hash
+        await state.save()
+        self.force_sync = False
 
     async def setup_hook(self) -> None:
         """Does setup stuff."""
         log.info("Performing initial setup")
+        self.startup_timings["login"] = time.perf_counter() - self.created_at
         await super().setup_hook()
-        await self.update_attrs()
-        await self.load_modules()
-        # raise
-        await self.register_commands()
+        with self.time_startup("attributes"):
+            await self.update_attrs()
+        with self.time_startup("modules"):
+            await self.load_modules(
+                [
+                    module
+                    for module in self.discover_modules()
+                    if module not in self.config.lazy_modules
+                ]
+            )
+            await self.load_extension("jishaku")
+            log.info("Loaded Jishaku (debug module)")
+        with self.time_startup("command sync"):
+            await self.register_commands()
         log.info("Initial setup complete")
+        if self.import_profiler:
+            self.import_profiler.uninstall()
+            log.info("Slowest imports:\n%s", self.import_profiler.report())
+
+    @contextmanager
+    def time_startup(self, step: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.startup_timings[step] = time.perf_counter() - start
 
     async def get_context(
         self,
@@ -119,6 +235,18 @@ class Kolkra(commands.Bot):
 
     async def on_ready(self) -> None:
         log.info("Ready!")
+        if "total" in self.startup_timings:
+            return  # Reconnected
+        self.startup_timings["total"] = time.perf_counter() - self.created_at
+        log.info(
+            "Startup breakdown: %s",
+            ", ".join(
+                f"{step} {seconds:.2f}s"
+                for step, seconds in self.startup_timings.items()
+            ),
+        )
+        if self.config.lazy_modules:
+            self.lazy_load_task = asyncio.create_task(self.load_lazy_modules())
 
     def typed_get_cog(self, cls: type[CogT]) -> CogT | None:
         cog = self.get_cog(cls.__cog_name__)
@@ -151,16 +279,42 @@ class Kolkra(commands.Bot):
         Returns:
             StaffLevel: The user's staff level.
         """
-        if not (
-            levels := [
+        key = (user.guild.id, user.id)
+        try:
+            return self._staff_level_cache[key]
+        except KeyError:
+            pass
+        level = next(
+            (
                 level
-                for level, roles in self.config.staff_roles.items()
-                if user.get_role(roles.permission_role)
-            ]
-        ):
-            return None
+                for role_id, level in self.staff_role_levels.items()
+                if user.get_role(role_id)
+            ),
+            None,
+        )
+        self._staff_level_cache[key] = level
+        return level
+
+    async def on_member_update(self, before: Member, after: Member) -> None:
+        if before.roles != after.roles:
+            self._staff_level_cache.pop((after.guild.id, after.id), None)
+
+    async def on_member_remove(self, member: Member) -> None:
+        self._staff_level_cache.pop((member.guild.id, member.id), None)
+
+    async def on_guild_remove(self, guild: Guild) -> None:
+        self.role_resolver.invalidate(guild.id)
+
+    async def on_guild_role_create(self, role: Role) -> None:
+        self.role_resolver.invalidate(role.guild.id)
+
+    async def on_guild_role_update(self, before: Role, after: Role) -> None:
+        self.role_resolver.invalidate(after.guild.id)
 
-        return max(levels)
+    async def on_guild_role_delete(self, role: Role) -> None:
+        self.role_resolver.invalidate(role.guild.id)
+        if role.id in self.staff_role_levels:
+            self._staff_level_cache.clear()
 
     async def close(self) -> None:
         log.info("Closing database connection")
@@ -3,7 +3,6 @@ import time
 from datetime import datetime
 from typing import TypeVar
 
-import psutil
 from discord import Embed, Thread
 from discord.ext import commands
 from discord.utils import Coro, format_dt
@@ -66,6 +65,8 @@ class BasicCog(commands.Cog):
     @commands.hybrid_command(aliases=["status"])
     async def ping(self, ctx: KolkraContext) -> None:
         """See various metrics about the bot."""
+        import psutil
+
         results: dict[str, str | Exception] = {}
 
         process_start = datetime.fromtimestamp(psutil.Process().create_time())
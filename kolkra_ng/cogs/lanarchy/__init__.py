@@ -36,7 +36,7 @@ class LANarchyCog(commands.Cog):
         self.config = LANarchyConfig(**bot.config.cogs.get(self.__cog_name__, {}))
 
     async def cog_load(self) -> None:
-        await self.bot.init_db_models(LANarchyProfile)
+        await self.bot.init_db_models()
 
     @commands.hybrid_group()
     async def lanarchy(self, ctx: KolkraContext) -> None:
@@ -3,7 +3,6 @@ from __future__ import annotations
 import logging
 from typing import Annotated, ClassVar
 
-import numpy as np
 from beanie import Document, Indexed
 from beanie.operators import GT, NE, Eq
 from discord import Embed
@@ -13,6 +12,7 @@ from typing_extensions import Self
 
 from kolkra_ng.bot import Kolkra
 from kolkra_ng.cogs.lanarchy.config import LANarchyConfig, RankConfig
+from kolkra_ng.db_registry import register_model
 from kolkra_ng.utils import safe_div
 
 log = logging.getLogger(__name__)
@@ -35,6 +35,7 @@ class Rank(BaseModel):
     points: int
 
 
+@register_model
 class LANarchyProfile(Document):
     user_id: Annotated[int, Indexed(unique=True)]
     openskill: OpenSkillData
@@ -127,6 +128,8 @@ class LANarchyProfile(Document):
         if len(ratings) <= 2:
             self.absolute_rank_points = base
         else:
+            import numpy as np
+
             self.absolute_rank_points = round(
                 np.polynomial.Polynomial.fit(ratings, points, 2)(self.openskill.mu)
             )
@@ -1,45 +1,62 @@
 import asyncio
 import logging
 import re
+from io import BytesIO
 
 from beanie import PydanticObjectId
-from beanie.operators import NE
+from beanie.operators import LT, NE, Eq, In
 from discord import (
     BanEntry,
+    ChannelType,
     Color,
+    DiscordServerError,
     Embed,
     File,
     Forbidden,
     Guild,
+    HTTPException,
     Member,
     Message,
     NotFound,
     Object,
     PartialMessageable,
+    RawBulkMessageDeleteEvent,
+    RawMessageDeleteEvent,
     User,
+    WebhookMessage,
 )
 from discord.abc import PrivateChannel, Snowflake
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord.utils import format_dt, sleep_until
+from pymongo import UpdateOne
 
 from kolkra_ng.bot import Kolkra
 from kolkra_ng.checks import is_staff_level
+from kolkra_ng.cogs.mod.action_index import ActiveActionIndex
+from kolkra_ng.cogs.mod.config import ModConfig
 from kolkra_ng.cogs.mod.converters import (
     ApplyFlags,
+    BulkApplyFlags,
     ChannelMuteApplyFlags,
     ChannelMuteLiftFlags,
     TargetConverter,
 )
+from kolkra_ng.cogs.mod.dm_cache import CANNOT_DM_USER, DMCache
+from kolkra_ng.cogs.mod.message_cache import MessageCache
 from kolkra_ng.cogs.mod.message_select import (
     SelectMessageFlags,
     generate_message_log,
     mass_delete,
 )
-from kolkra_ng.cogs.mod.mod_actions.abc import ModAction, ModActionLift
+from kolkra_ng.cogs.mod.mod_actions.abc import (
+    BULK_CONCURRENCY,
+    ModAction,
+    ModActionLift,
+)
 from kolkra_ng.cogs.mod.mod_actions.channel_mute import MUTE_PERMS, ChannelMute
 from kolkra_ng.cogs.mod.mod_actions.server_ban import ServerBan
 from kolkra_ng.cogs.mod.mod_actions.softban import Softban
-from kolkra_ng.cogs.mod.mod_actions.warning import ModWarning
+from kolkra_ng.cogs.mod.mod_actions.warning import ModWarning, WarningCount
 from kolkra_ng.context import KolkraContext
 from kolkra_ng.embeds import (
     AccessDeniedEmbed,
@@ -58,21 +75,39 @@ from kolkra_ng.views.pager import Pager, group_embeds
 log = logging.getLogger(__name__)
 
 
+dm_cache = DMCache()
+
+
 async def try_dm(bot: Kolkra, user_id: int, **kwargs) -> Message | None:
-    if (
-        dmable := bot.get_user(user_id)
-        or await bot.fetch_user(user_id)
-        or await bot.create_dm(Object(user_id))
-    ):
+    if dm_cache.is_closed(user_id):
+        log.info("Not DMing user ID %s, they recently had DMs closed", user_id)
+        return None
+    if (channel_id := dm_cache.get_channel(user_id)) is not None:
+        dmable = bot.get_partial_messageable(channel_id, type=ChannelType.private)
+    else:
         try:
-            return await dmable.send(**kwargs)
+            dmable = await bot.create_dm(bot.get_user(user_id) or Object(user_id))
         except Exception as e:
-            log.warn("Couldn't send DM to %s", dmable, exc_info=exc_info(e))
-    else:
-        log.warn("Can't get DM channel for user ID %s", user_id)
+            log.warn(
+                "Can't get DM channel for user ID %s", user_id, exc_info=exc_info(e)
+            )
+            return None
+        dm_cache.put_channel(user_id, dmable.id)
+    try:
+        return await dmable.send(**kwargs)
+    except Exception as e:
+        if isinstance(e, Forbidden) and e.code == CANNOT_DM_USER:
+            dm_cache.mark_closed(user_id)
+        log.warn("Couldn't send DM to %s", user_id, exc_info=exc_info(e))
 
 
 MOD_ACTION_MODELS = [ServerBan, Softban, ChannelMute, ModWarning]
+RESTORE_ATTEMPTS = 3
+
+# Per-step timeouts for ModCog.do_apply, in seconds
+DM_TIMEOUT = 10
+APPLY_TIMEOUT = 30
+LOG_TIMEOUT = 15
 
 
 async def fetch_ban(target: Snowflake, guild: Guild) -> BanEntry | None:
@@ -86,7 +121,11 @@ class ModCog(commands.Cog):
     def __init__(self, bot: Kolkra) -> None:
         super().__init__()
         self.bot = bot
+        self.config = ModConfig(**bot.config.cogs.get(self.__cog_name__, {}))
         self.__lift_tasks: dict[PydanticObjectId | None, asyncio.Task] = {}
+        self.__follow_up_tasks: set[asyncio.Task] = set()
+        self.message_cache = MessageCache(bot, self.config.message_cache_size)
+        self.active_actions = ActiveActionIndex()
 
     async def __delayed_lift(self, action: ModAction) -> None:
         if not action.expiration:
@@ -104,38 +143,155 @@ class ModCog(commands.Cog):
         )
 
     async def cog_load(self) -> None:
-        await self.bot.init_db_models(*MOD_ACTION_MODELS)
+        await self.bot.init_db_models()
+        if (
+            not await WarningCount.count()
+            or await WarningCount.find(LT(WarningCount.active_warnings, 0)).count()
+        ):
+            # Backfill counts for warnings issued before they were tracked, or repair ones that were decremented
+            # too often
+            await WarningCount.rebuild()
         for cls in MOD_ACTION_MODELS:
-            async for action in cls.find(NE(cls.expiration, None)):
+            async for action in cls.find(
+                NE(cls.expiration, None), Eq(cls.lifted, None)
+            ):
                 log.info("Creating lift task for %s", action)
                 self.__lift_tasks[action.id] = self.bot.loop.create_task(
                     self.__delayed_lift(action)
                 )
+        await self.active_actions.reload()
+        self.reconcile_active_actions.change_interval(
+            seconds=self.config.reconcile_interval
+        )
+        self.reconcile_active_actions.start()
 
     async def cog_unload(self) -> None:
+        self.reconcile_active_actions.cancel()
         for k in list(self.__lift_tasks):
             self.__lift_tasks.pop(k).cancel()
 
+    @tasks.loop(minutes=10)
+    async def reconcile_active_actions(self) -> None:
+        await self.active_actions.reload()
+
+    @reconcile_active_actions.before_loop
+    async def before_reconcile(self) -> None:
+        # The index was just loaded in cog_load
+        await asyncio.sleep(self.config.reconcile_interval)
+
     async def do_apply(
         self,
         action: ModAction,
         silent: bool = False,
     ) -> None:
+        """Saves and applies a mod action, DMs the target and posts it to the modlog.
+
+        The action is saved first, since the DM and log embeds may read it back (e.g. warning counts).
+        After that, the target is DMed and then the action is applied--we may not be able to reach them
+        after a ban--while the modlog post goes out alongside.
+        If applying fails, the action is rolled back and its modlog entry is marked as not applied;
+        otherwise the rendered modlog embed is stored with it.
+
+        Args:
+            action (ModAction): The action to apply.
+            silent (bool, optional): Whether to skip DMing the target. Defaults to False.
+        """
         await action.save()
-        if not silent:
-            await try_dm(
-                self.bot,
-                action.target_id,
-                embed=await action.dm_embed(self.bot),
+        await action.after_create()
+        await action.render_log_payload()
+        self.active_actions.add(action)
+
+        async def dm_then_apply() -> None:
+            if not silent:
+                try:
+                    await asyncio.wait_for(
+                        try_dm(
+                            self.bot,
+                            action.target_id,
+                            embed=await action.dm_embed(self.bot),
+                        ),
+                        DM_TIMEOUT,
+                    )
+                except asyncio.TimeoutError:
+                    log.warning("Timed out DMing target of %s", action)
+            await asyncio.wait_for(action.apply(self), APPLY_TIMEOUT)
+
+        async def post_log() -> WebhookMessage | None:
+            return await asyncio.wait_for(
+                self.bot.webhooks.send(
+                    self.bot.log_channel, embed=await action.log_embed(), wait=True
+                ),
+                LOG_TIMEOUT,
             )
-        await action.apply(self)
+
+        log_post = asyncio.create_task(post_log())
+        try:
+            await dm_then_apply()
+        except Exception as e:
+            log.warning("Failed to apply %s, rolling it back", action, exc_info=e)
+            self.active_actions.discard(action)
+            await action.undo_create()
+            await self.mark_not_applied(log_post, action, e)
+            raise
         if action.expiration:
             self.__lift_tasks[action.id] = self.bot.loop.create_task(
                 self.__delayed_lift(action)
             )
-        await self.bot.webhooks.send(
-            self.bot.log_channel, embed=await action.log_embed()
+        await asyncio.gather(
+            log_post, action.set({"log_payload": action.log_payload}, skip_sync=True)
+        )
+
+    def apply_later(self, action: ModAction, silent: bool = False) -> None:
+        """Applies an action in the background, e.g. an auto-ban triggered by applying another action.
+
+        The action gets its own timeouts and rollback, so if it fails, the action that triggered it still stands.
+
+        Args:
+            action (ModAction): The action to apply.
+            silent (bool, optional): Whether to skip DMing the target. Defaults to False.
+        """
+        task = self.bot.loop.create_task(self.__apply_follow_up(action, silent))
+        self.__follow_up_tasks.add(task)
+        task.add_done_callback(self.__follow_up_tasks.discard)
+
+    async def __apply_follow_up(self, action: ModAction, silent: bool) -> None:
+        try:
+            await self.do_apply(action, silent)
+        except Exception as e:
+            log.warning("Follow-up action %s failed to apply", action, exc_info=e)
+
+    async def mark_not_applied(
+        self,
+        log_post: "asyncio.Task[WebhookMessage | None]",
+        action: ModAction,
+        error: Exception,
+    ) -> None:
+        """Edits the modlog entry for an action that failed to apply, so it doesn't read as if it took effect.
+
+        Args:
+            log_post (asyncio.Task[WebhookMessage | None]): The task posting the entry.
+            action (ModAction): The action that failed.
+            error (Exception): Why it failed.
+        """
+        try:
+            message = await log_post
+        except Exception as e:
+            log.warning("Couldn't post modlog entry for %s", action, exc_info=e)
+            return
+        if not (message and message.embeds):
+            return
+        embed = message.embeds[0]
+        embed.title = f"{embed.title} (not applied)"
+        embed.colour = Color.dark_grey()
+        embed.add_field(
+            name="Not applied",
+            value=f"Applying this {action.noun()} failed ({type(error).__name__}), so it was rolled back.",
+            inline=False,
         )
+        try:
+            await message.edit(embed=embed)
+        except HTTPException as e:
+            log.warning("Couldn't mark modlog entry for %s", action, exc_info=e)
 
     async def do_lift(
         self,
@@ -153,15 +309,43 @@ class ModCog(commands.Cog):
             lift_reason (str | None): The reason the action is being lifted.
             __exp (bool, optional): Internal flag to prevent the expiration task from cancelling itself. Defaults to False.
         """
+        if action.lifted:
+            # Lifting twice would e.g. take a warning off the user's count twice
+            log.info("%s was already lifted, skipping", action)
+            return
         await action.lift(self, author, lift_reason)
         if (task := self.__lift_tasks.pop(action.id, None)) and not __exp:
             task.cancel()
         action.lifted = ModActionLift(lifter_id=author.id, reason=lift_reason)
+        await action.render_log_payload()
         await action.save()
+        self.active_actions.discard(action)
         await self.bot.webhooks.send(
             self.bot.log_channel, embed=await action.log_embed()
         )
 
+    @commands.Cog.listener("on_message")
+    async def cache_message(self, message: Message) -> None:
+        if message.guild:
+            self.message_cache.add(message)
+
+    @commands.Cog.listener("on_message_edit")
+    async def update_cached_message(self, before: Message, after: Message) -> None:
+        self.message_cache.update(after)
+
+    @commands.Cog.listener("on_raw_message_delete")
+    async def uncache_message(self, payload: RawMessageDeleteEvent) -> None:
+        self.message_cache.remove(payload.channel_id, [payload.message_id])
+
+    @commands.Cog.listener("on_raw_bulk_message_delete")
+    async def uncache_messages(self, payload: RawBulkMessageDeleteEvent) -> None:
+        self.message_cache.remove(payload.channel_id, payload.message_ids)
+
+    @commands.Cog.listener("on_ready")
+    async def invalidate_message_cache(self) -> None:
+        # A fresh session means we may have missed messages while disconnected.
+        self.message_cache.invalidate()
+
     @commands.hybrid_command(aliases=["purge", "clean"])
     @commands.guild_only()
     @is_staff_level(StaffLevel.mod)
@@ -171,7 +355,7 @@ class ModCog(commands.Cog):
     ) -> None:
         """Delete multiple messages at once according to several criteria."""
         await ctx.defer()
-        if not (matches := await flags.find_matches(ctx.channel)):
+        if not (matches := await flags.find_matches(ctx.channel, self.message_cache)):
             await ctx.respond(
                 embed=InfoEmbed(
                     title="No messages found",
@@ -281,8 +465,211 @@ class ModCog(commands.Cog):
             return
         await ctx.respond(embed=OkEmbed(description=f"{target} is now unb&."))
 
+    def resolve_bulk_targets(
+        self, guild: Guild, flags: BulkApplyFlags
+    ) -> list[Member | Object]:
+        """Collect the targets of a bulk action: every listed ID, plus every member matching all given join window/name criteria."""
+        targets: dict[int, Member | Object] = {
+            user_id: guild.get_member(user_id) or Object(user_id)
+            for user_id in flags.ids or []
+        }
+        if not (flags.joined_after or flags.joined_before or flags.name):
+            return list(targets.values())
+        for member in guild.members:
+            if flags.joined_after and (
+                not member.joined_at or member.joined_at < flags.joined_after
+            ):
+                continue
+            if flags.joined_before and (
+                not member.joined_at or member.joined_at > flags.joined_before
+            ):
+                continue
+            if flags.name and not (
+                flags.name.search(member.name) or flags.name.search(member.display_name)
+            ):
+                continue
+            targets[member.id] = member
+        return list(targets.values())
+
+    async def do_bulk_apply(  # noqa: C901
+        self,
+        ctx: KolkraContext,
+        cls: type[ModAction],
+        flags: BulkApplyFlags,
+    ) -> None:
+        """Applies a mod action to many targets at once, with one DB write and one modlog entry.
+
+        Args:
+            ctx (KolkraContext): The invocation context.
+            cls (type[ModAction]): The type of action to apply.
+            flags (BulkApplyFlags): The targeting criteria and action details.
+        """
+        if not (ctx.guild and isinstance(ctx.author, Member)):
+            raise commands.NoPrivateMessage()
+        await ctx.defer()
+        targets = self.resolve_bulk_targets(ctx.guild, flags)
+
+        converter = TargetConverter(cls.noun())
+
+        async def check(target: Member | Object) -> None:
+            if isinstance(target, Member):
+                await converter.check(
+                    ctx.bot, ctx.author, target  # pyright: ignore [reportArgumentType]
+                )
+            else:
+                await converter.check_user(
+                    ctx.bot, ctx.author, target  # pyright: ignore [reportArgumentType]
+                )
+
+        skipped: list[tuple[Member | Object, str]] = []
+        allowed: list[Member | Object] = []
+        for target, result in zip(
+            targets,
+            await asyncio.gather(*map(check, targets), return_exceptions=True),
+            strict=True,
+        ):
+            if isinstance(result, commands.CheckFailure):
+                skipped.append((target, str(result)))
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                allowed.append(target)
+        existing = {
+            action.target_id
+            for action in await cls.fetch_existing_for_many(
+                ctx.guild.id, (t.id for t in allowed)
+            ).to_list()
+        }
+        skipped.extend(
+            (t, f"Already has a {cls.noun()}") for t in allowed if t.id in existing
+        )
+        allowed = [t for t in allowed if t.id not in existing]
+
+        if not allowed:
+            await ctx.respond(
+                embed=InfoEmbed(
+                    title="No targets",
+                    description=f"None of the users you specified can be given a {cls.noun()}.",
+                )
+            )
+            return
+        target_log = BytesIO(
+            "\n".join(
+                [f"{t.id} {t}" for t in allowed]
+                + [f"{t.id} {t} (skipped: {reason})" for t, reason in skipped]
+            ).encode()
+        )
+        if not await Confirm(ctx.author).respond(
+            ctx,
+            embed=WarningEmbed(
+                description=f"You are about to apply a {cls.noun()} to {len(allowed)} users "
+                f"(listed in the attached file, along with {len(skipped)} skipped users). "
+                "Are you sure you want to continue?"
+            ),
+            file=File(target_log, filename=f"{ctx.invocation_id}.targets.txt"),
+        ):
+            return
+
+        actions = [
+            cls(
+                guild_id=ctx.guild.id,
+                issuer_id=ctx.author.id,
+                target_id=target.id,
+                reason=flags.reason,
+                expiration=flags.expiration,
+            )
+            for target in allowed
+        ]
+        await cls.insert_many(actions)
+        await asyncio.gather(*(a.after_create() for a in actions))
+        await asyncio.gather(*(a.render_log_payload() for a in actions))
+        for action in actions:
+            self.active_actions.add(action)
+        if not flags.silent:
+            semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+            members = {t.id for t in allowed if isinstance(t, Member)}
+
+            async def dm(action: ModAction) -> None:
+                async with semaphore:
+                    await try_dm(
+                        self.bot,
+                        action.target_id,
+                        embed=await action.dm_embed(self.bot),
+                    )
+
+            await asyncio.gather(*(dm(a) for a in actions if a.target_id in members))
+        failed = await cls.apply_many(self, actions)
+        failed_ids = {a.id for a in failed}
+        if failed:
+            await cls.find(In(cls.id, list(failed_ids))).delete()
+            for action in failed:
+                self.active_actions.discard(action)
+        applied = [a for a in actions if a.id not in failed_ids]
+        if applied:
+            await cls.get_motor_collection().bulk_write(
+                [
+                    UpdateOne({"_id": a.id}, {"$set": {"log_payload": a.log_payload}})
+                    for a in applied
+                ],
+                ordered=False,
+            )
+        for action in applied:
+            if action.expiration:
+                self.__lift_tasks[action.id] = self.bot.loop.create_task(
+                    self.__delayed_lift(action)
+                )
+
+        summary = actions[0].log_base()
+        summary.title = f"{summary.title} (bulk)"
+        summary.add_field(
+            name="Issued",
+            value=f"by {ctx.author.mention} at {format_dt(actions[0].timestamp)}",
+        ).add_field(name="Reason", value=flags.reason).add_field(
+            name="Expiration",
+            value=(format_dt(flags.expiration) if flags.expiration else "None"),
+        ).add_field(
+            name="Results",
+            value=f"{len(applied)} applied, {len(failed)} failed, {len(skipped)} skipped",
+        )
+        result_log = BytesIO(
+            "\n".join(
+                [f"{a.target_id} {a.get_collection_name()}:{a.id}" for a in applied]
+                + [f"{a.target_id} (failed)" for a in failed]
+                + [f"{t.id} {t} (skipped: {reason})" for t, reason in skipped]
+            ).encode()
+        )
+        await self.bot.webhooks.send(
+            self.bot.log_channel,
+            embed=summary,
+            file=File(result_log, filename=f"{ctx.invocation_id}.targets.txt"),
+        )
+        await ctx.send(
+            embed=OkEmbed(
+                description=f"Applied a {cls.noun()} to {len(applied)} users."
+                + (f" {len(failed)} failed." if failed else "")
+            )
+        )
+
+    @commands.hybrid_command(aliases=["massban", "raidban"])
+    @commands.guild_only()
+    @is_staff_level(StaffLevel.mod)
+    @commands.bot_has_permissions(ban_members=True)
+    async def mass_ban(self, ctx: KolkraContext, *, flags: BulkApplyFlags) -> None:
+        """Ban many users at once by ID, join time and/or name."""
+        await self.do_bulk_apply(ctx, ServerBan, flags)
+
+    @commands.hybrid_command(aliases=["masssoftban", "raidsoftban"])
+    @commands.guild_only()
+    @is_staff_level(StaffLevel.mod)
+    @commands.bot_has_permissions(kick_members=True)
+    async def mass_softban(self, ctx: KolkraContext, *, flags: BulkApplyFlags) -> None:
+        """Softban many users at once by ID, join time and/or name."""
+        await self.do_bulk_apply(ctx, Softban, flags)
+
     @commands.Cog.listener("on_member_join")
     async def enforce_softban(self, member: Member) -> None:
+        if not self.active_actions.is_softbanned(member.guild.id, member.id):
+            return
         if not (
             action := await Softban.fetch_existing_for(member.guild.id, member.id)
             .find(ignore_cache=True)
@@ -402,18 +789,62 @@ class ModCog(commands.Cog):
 
     @commands.Cog.listener("on_member_join")
     async def restore_channel_mutes(self, member: Member) -> None:
+        if not self.active_actions.muted_channels(member.guild.id, member.id):
+            return
         allow, deny = MUTE_PERMS.pair()
-        async for action in ChannelMute.fetch_existing_for(
-            member.guild.id, member.id
-        ).find(ignore_cache=True):
-            await self.bot.http.edit_channel_permissions(
-                action.channel_id,
-                action.target_id,
-                str(allow.value),
-                str(deny.value),
-                1,  # Individual member
-                reason="Restoring channel mutes to returning member",
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+        async def restore(action: ChannelMute) -> bool:
+            async with semaphore:
+                for attempt in range(RESTORE_ATTEMPTS):
+                    try:
+                        await self.bot.http.edit_channel_permissions(
+                            action.channel_id,
+                            action.target_id,
+                            str(allow.value),
+                            str(deny.value),
+                            1,  # Individual member
+                            reason="Restoring channel mutes to returning member",
+                        )
+                    except (DiscordServerError, OSError, asyncio.TimeoutError) as e:
+                        log.warning(
+                            "Transient error restoring %s (attempt %s/%s)",
+                            action,
+                            attempt + 1,
+                            RESTORE_ATTEMPTS,
+                            exc_info=e,
+                        )
+                        if attempt + 1 < RESTORE_ATTEMPTS:
+                            await asyncio.sleep(2**attempt)
+                    except Exception as e:
+                        log.warning("Failed to restore %s", action, exc_info=e)
+                        return False
+                    else:
+                        return True
+            return False
+
+        results = await asyncio.gather(
+            *map(
+                restore,
+                await ChannelMute.fetch_existing_for(member.guild.id, member.id)
+                .find(ignore_cache=True)
+                .to_list(),
+            )
+        )
+        if not results:
+            return
+        restored = results.count(True)
+        await self.bot.webhooks.send(
+            self.bot.log_channel,
+            embed=Embed(
+                title="Channel mutes restored",
+                description=f"{member.mention} rejoined while muted in some channels.",
+                color=Color.orange() if restored == len(results) else Color.red(),
             )
+            .set_thumbnail(url=icons8("mute"))
+            .add_field(name="Restored", value=restored)
+            .add_field(name="Failed", value=len(results) - restored),
+        )
 
     @commands.hybrid_command(aliases=["shaddap"])
     @commands.guild_only()
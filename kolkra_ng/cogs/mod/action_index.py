@@ -0,0 +1,73 @@
+"""Keeps the mod actions that need enforcing on member join in memory, so joins don't have to hit the DB."""
+
+import logging
+from collections import defaultdict
+
+from beanie.operators import Eq
+
+from kolkra_ng.cogs.mod.mod_actions.abc import ModAction
+from kolkra_ng.cogs.mod.mod_actions.channel_mute import ChannelMute
+from kolkra_ng.cogs.mod.mod_actions.softban import Softban
+
+log = logging.getLogger(__name__)
+
+
+class ActiveActionIndex:
+    """An in-memory mirror of active softbans and channel mutes, keyed by (guild ID, user ID)."""
+
+    def __init__(self) -> None:
+        self.softbans: set[tuple[int, int]] = set()
+        self.channel_mutes: defaultdict[tuple[int, int], set[int]] = defaultdict(set)
+        # Changes made while a reload is in flight, to replay on top of the fresh data
+        self._pending: list[tuple[bool, ModAction]] | None = None
+
+    def is_softbanned(self, guild_id: int, user_id: int) -> bool:
+        return (guild_id, user_id) in self.softbans
+
+    def muted_channels(self, guild_id: int, user_id: int) -> set[int]:
+        return self.channel_mutes.get((guild_id, user_id), set())
+
+    def _apply_change(self, active: bool, action: ModAction) -> None:
+        key = (action.guild_id, action.target_id)
+        if isinstance(action, Softban):
+            (self.softbans.add if active else self.softbans.discard)(key)
+        elif isinstance(action, ChannelMute):
+            if active:
+                self.channel_mutes[key].add(action.channel_id)
+            elif channels := self.channel_mutes.get(key):
+                channels.discard(action.channel_id)
+                if not channels:
+                    del self.channel_mutes[key]
+
+    def add(self, action: ModAction) -> None:
+        if self._pending is not None:
+            self._pending.append((True, action))
+        self._apply_change(True, action)
+
+    def discard(self, action: ModAction) -> None:
+        if self._pending is not None:
+            self._pending.append((False, action))
+        self._apply_change(False, action)
+
+    async def reload(self) -> None:
+        """Rebuild the index from the database."""
+        self._pending = []
+        try:
+            softbans = {
+                (action.guild_id, action.target_id)
+                async for action in Softban.find(Eq(Softban.lifted, None))
+            }
+            channel_mutes: defaultdict[tuple[int, int], set[int]] = defaultdict(set)
+            async for action in ChannelMute.find(Eq(ChannelMute.lifted, None)):
+                channel_mutes[(action.guild_id, action.target_id)].add(
+                    action.channel_id
+                )
+            if not self._pending and (
+                softbans != self.softbans or channel_mutes != self.channel_mutes
+            ):
+                log.info("Active mod action index was out of sync with the database")
+            self.softbans, self.channel_mutes = softbans, channel_mutes
+            for active, action in self._pending:
+                self._apply_change(active, action)
+        finally:
+            self._pending = None
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field, PositiveFloat, PositiveInt
+
+
+class ModConfig(BaseModel):
+    message_cache_size: PositiveInt = Field(
+        default=1000,
+        description="How many recent messages to keep per channel for mass deletes, on top of discord.py's own cache.",
+    )
+    reconcile_interval: PositiveFloat = Field(
+        default=600,
+        description="How often, in seconds, to resync the in-memory softban/channel mute index with the database.",
+    )
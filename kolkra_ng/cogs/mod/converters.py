@@ -1,8 +1,9 @@
+import re
 from datetime import datetime
 from typing import ClassVar
 
 from discord import AppCommandOptionType, Interaction, Member, app_commands
-from discord.abc import GuildChannel
+from discord.abc import GuildChannel, Snowflake
 from discord.ext import commands
 
 from kolkra_ng.bot import Kolkra
@@ -63,14 +64,18 @@ class TargetConverter(commands.MemberConverter, app_commands.Transformer):
         self.verb = verb
         self.check_existing = check_existing
 
-    async def check(self, bot: Kolkra, author: Member, target: Member) -> None:
+    async def check_user(self, bot: Kolkra, author: Member, target: Snowflake) -> None:
+        """The subset of checks that still make sense for users who aren't in the server."""
         if author.id == target.id:
             raise TargetSelf(self.verb)
         elif target.id == bot.user.id:  # pyright: ignore [reportOptionalMemberAccess]
             raise TargetMe(self.verb)
-        elif await bot.is_owner(target):
+        elif await bot.is_owner(target):  # pyright: ignore [reportArgumentType]
             raise TargetDev(self.verb)
-        elif target.bot:
+
+    async def check(self, bot: Kolkra, author: Member, target: Member) -> None:
+        await self.check_user(bot, author, target)
+        if target.bot:
             raise TargetBot(self.verb)
         elif (bot.get_staff_level_for(author) or 0) <= (
             bot.get_staff_level_for(target) or 0
@@ -122,6 +127,57 @@ class ApplyFlags(Flags):
     )
 
 
+class NoSnowflakes(commands.BadArgument):
+    def __init__(self, argument: str) -> None:
+        super().__init__(f"{argument!r} does not contain any user IDs.")
+
+
+def snowflake_list(argument: str) -> list[int]:
+    if not (ids := [int(i) for i in re.findall(r"\d{15,20}", argument)]):
+        raise NoSnowflakes(argument)
+    return ids
+
+
+class BulkApplyFlags(Flags):
+    reason: str | None = commands.flag(
+        aliases=["r"],
+        default=None,
+        positional=True,
+    )
+    expiration: datetime | None = commands.flag(
+        aliases=["e", "until"],
+        default=None,
+        converter=DatetimeConverter(prefer_dates_from="future"),
+    )
+    silent: bool = commands.flag(
+        aliases=["nodm", "quiet"],
+        default=False,
+    )
+    ids: list[int] | None = commands.flag(
+        aliases=["users"],
+        default=None,
+        converter=snowflake_list,
+        description="User IDs to target, separated by spaces or commas.",
+    )
+    joined_after: datetime | None = commands.flag(
+        aliases=["since"],
+        default=None,
+        converter=DatetimeConverter(prefer_dates_from="past"),
+        description="Target members who joined after this date/time.",
+    )
+    joined_before: datetime | None = commands.flag(
+        default=None,
+        converter=DatetimeConverter(prefer_dates_from="past"),
+        description="Target members who joined before this date/time.",
+    )
+    name: re.Pattern[str] | None = commands.flag(
+        aliases=["matches", "pattern"],
+        default=None,
+        converter=re.compile,
+        description="Target members whose username or display name matches this regular expression.",
+    )
+
+
 class ChannelMuteApplyFlags(Flags):
     reason: str | None = commands.flag(
         aliases=["r"],
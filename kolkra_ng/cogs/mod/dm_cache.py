@@ -0,0 +1,42 @@
+"""Remembers DM channels (and users who won't accept DMs) so moderation DMs don't cost extra API calls."""
+
+import time
+from collections import OrderedDict
+
+CANNOT_DM_USER = 50007
+"""Discord's error code for "Cannot send messages to this user"."""
+
+
+class DMCache:
+    """A bounded LRU of user ID -> DM channel ID, plus a TTL'd memo of users with closed DMs."""
+
+    def __init__(self, max_size: int = 1000, closed_ttl: float = 3600) -> None:
+        self.max_size = max_size
+        self.closed_ttl = closed_ttl
+        self._channels: OrderedDict[int, int] = OrderedDict()
+        self._closed: OrderedDict[int, float] = OrderedDict()
+
+    def get_channel(self, user_id: int) -> int | None:
+        if (channel_id := self._channels.get(user_id)) is not None:
+            self._channels.move_to_end(user_id)
+        return channel_id
+
+    def put_channel(self, user_id: int, channel_id: int) -> None:
+        self._channels[user_id] = channel_id
+        self._channels.move_to_end(user_id)
+        while len(self._channels) > self.max_size:
+            self._channels.popitem(last=False)
+
+    def is_closed(self, user_id: int) -> bool:
+        if (expires := self._closed.get(user_id)) is None:
+            return False
+        if expires <= time.monotonic():
+            del self._closed[user_id]
+            return False
+        return True
+
+    def mark_closed(self, user_id: int) -> None:
+        self._closed[user_id] = time.monotonic() + self.closed_ttl
+        self._closed.move_to_end(user_id)
+        while len(self._closed) > self.max_size:
+            self._closed.popitem(last=False)
@@ -0,0 +1,201 @@
+"""A per-channel ring buffer of recently seen messages, so purges don't have to refetch what the gateway just gave us."""
+
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from enum import IntFlag
+from typing import Literal
+
+from discord import Client, Message
+from discord.utils import utcnow
+from typing_extensions import Self
+
+EMOTE_REGEX = re.compile(
+    r"<a?:(\w+):(\d+)>"
+)  # Thanks Danny! ;) (https://github.com/Rapptz/RoboDanny/blob/rewrite/cogs/mod.py#L3515)
+
+
+class CachedMessageFlags(IntFlag):
+    bot = 1 << 0
+    webhook = 1 << 1
+    system = 1 << 2
+    embeds = 1 << 3
+    attachments = 1 << 4
+    stickers = 1 << 5
+    emotes = 1 << 6
+
+
+class CachedMessage:
+    """A message, plus a compact summary of it that's quick to rule it out by."""
+
+    __slots__ = (
+        "id",
+        "author_id",
+        "created_at",
+        "flags",
+        "mention_ids",
+        "message",
+    )
+
+    def __init__(
+        self,
+        id: int,  # noqa: A002
+        author_id: int,
+        created_at: datetime,
+        flags: CachedMessageFlags,
+        mention_ids: frozenset[int],
+        message: Message,
+    ) -> None:
+        self.id = id
+        self.author_id = author_id
+        self.created_at = created_at
+        self.flags = flags
+        self.mention_ids = mention_ids
+        self.message = message
+
+    @classmethod
+    def from_message(cls, message: Message) -> Self:
+        flags = CachedMessageFlags(0)
+        if message.author.bot:
+            flags |= CachedMessageFlags.bot
+        if message.webhook_id:
+            flags |= CachedMessageFlags.webhook
+        if message.is_system():
+            flags |= CachedMessageFlags.system
+        if message.embeds:
+            flags |= CachedMessageFlags.embeds
+        if message.attachments:
+            flags |= CachedMessageFlags.attachments
+        if message.stickers:
+            flags |= CachedMessageFlags.stickers
+        if EMOTE_REGEX.search(message.content):
+            flags |= CachedMessageFlags.emotes
+        return cls(
+            id=message.id,
+            author_id=message.author.id,
+            created_at=message.created_at,
+            flags=flags,
+            mention_ids=frozenset(message.raw_mentions),
+            message=message,
+        )
+
+    @property
+    def user_type(self) -> Literal["human", "bot", "webhook", "system"]:
+        # Same precedence as message_select.get_user_type
+        if self.flags & CachedMessageFlags.bot:
+            return "bot"
+        elif self.flags & CachedMessageFlags.webhook:
+            return "webhook"
+        elif self.flags & CachedMessageFlags.system:
+            return "system"
+        else:
+            return "human"
+
+    def __repr__(self) -> str:
+        return f"<CachedMessage id={self.id} author_id={self.author_id}>"
+
+
+class _ChannelBuffer:
+    __slots__ = ("records", "complete_since")
+
+    def __init__(self, max_size: int) -> None:
+        self.records: deque[CachedMessage] = deque(maxlen=max_size)
+        # Every message in this channel newer than this is in the buffer (minus deleted ones).
+        self.complete_since = utcnow()
+
+
+class MessageCache:
+    """Keeps a bounded ring buffer of `CachedMessage`s for each channel, newest last.
+
+    Records hold on to their messages, so they outlive discord.py's own (global) message cache.
+    Anything that changes without an edit, like reactions and pins, is only kept current by that cache though.
+    """
+
+    def __init__(self, client: Client, max_size: int) -> None:
+        self.client = client
+        self.max_size = max_size
+        self._channels: dict[int, _ChannelBuffer] = {}
+
+    def add(self, message: Message) -> None:
+        if not (buf := self._channels.get(message.channel.id)):
+            buf = self._channels[message.channel.id] = _ChannelBuffer(self.max_size)
+        if len(buf.records) == buf.records.maxlen:
+            buf.complete_since = buf.records[0].created_at
+        buf.records.append(CachedMessage.from_message(message))
+
+    def update(self, message: Message) -> None:
+        if not (buf := self._channels.get(message.channel.id)):
+            return
+        for i in range(len(buf.records) - 1, -1, -1):
+            if buf.records[i].id == message.id:
+                buf.records[i] = CachedMessage.from_message(message)
+                return
+
+    def remove(self, channel_id: int, message_ids: Iterable[int]) -> None:
+        if not (buf := self._channels.get(channel_id)):
+            return
+        ids = set(message_ids)
+        buf.records = deque(
+            (r for r in buf.records if r.id not in ids), maxlen=buf.records.maxlen
+        )
+
+    def invalidate(self) -> None:
+        """Forget what we know about completeness, e.g. after a new gateway session may have missed messages."""
+        now = utcnow()
+        for buf in self._channels.values():
+            buf.complete_since = now
+
+    def history(
+        self,
+        channel_id: int,
+        *,
+        before: datetime | None = None,
+        after: datetime | None = None,
+        oldest_first: bool = False,
+    ) -> Iterator[CachedMessage]:
+        """Iterate over cached records for a channel, within an optional time range.
+
+        Args:
+            channel_id (int): The channel to look up.
+            before (datetime | None, optional): Only yield records older than this. Defaults to None.
+            after (datetime | None, optional): Only yield records newer than this. Defaults to None.
+            oldest_first (bool, optional): Whether to go from oldest to newest instead. Defaults to False.
+
+        Yields:
+            CachedMessage: The matching records.
+        """
+        if not (buf := self._channels.get(channel_id)):
+            return
+        if oldest_first:
+            for record in buf.records:
+                if after and record.created_at <= after:
+                    continue
+                if before and record.created_at >= before:
+                    return
+                yield record
+            return
+        for record in reversed(buf.records):
+            if before and record.created_at >= before:
+                continue
+            if after and record.created_at <= after:
+                return
+            yield record
+
+    def covers(self, channel_id: int, since: datetime | None) -> bool:
+        """Whether every message in a channel from a point in time onward is known to the cache.
+
+        Args:
+            channel_id (int): The channel to check.
+            since (datetime | None): The start of the range. None means the beginning of the channel.
+
+        Returns:
+            bool: True if there is no need to go to the API for anything newer than `since`.
+        """
+        if since is None or not (buf := self._channels.get(channel_id)):
+            return False
+        return since >= buf.complete_since
+
+    def resolver(self) -> dict[int, Message]:
+        """Snapshot the client's message cache, for looking up the live versions of messages by ID."""
+        return {m.id: m for m in self.client.cached_messages}
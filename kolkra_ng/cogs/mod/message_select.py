@@ -5,11 +5,17 @@ from functools import cached_property
 from io import BytesIO
 from typing import TYPE_CHECKING, Literal
 
-from discord import Member, Message, User
+from discord import Member, Message, Object, User
 from discord.abc import GuildChannel
 from discord.ext import commands
 from discord.utils import utcnow
 
+from kolkra_ng.cogs.mod.message_cache import (
+    EMOTE_REGEX,
+    CachedMessage,
+    CachedMessageFlags,
+    MessageCache,
+)
 from kolkra_ng.converters import DatetimeConverter, Flags
 from kolkra_ng.utils import audit_log_reason_template
 
@@ -139,10 +145,7 @@ class SelectMessageFlags(Flags):
         if reactions := self.reactions:
             predicates.append(lambda m: reactions == bool(m.reactions))
         if emotes := self.emotes:
-            emote_regex = re.compile(
-                r"<a?:(\w+):(\d+)>"
-            )  # Thanks Danny! ;) (https://github.com/Rapptz/RoboDanny/blob/rewrite/cogs/mod.py#L3515)
-            predicates.append(lambda m: emotes == bool(emote_regex.search(m.content)))
+            predicates.append(lambda m: emotes == bool(EMOTE_REGEX.search(m.content)))
         if stickers := self.stickers:
             predicates.append(lambda m: stickers == bool(m.stickers))
         if pinned := self.pinned:
@@ -155,13 +158,90 @@ class SelectMessageFlags(Flags):
 
         return inner
 
-    async def find_matches(self, channel: "MessageableChannel") -> list[Message]:
+    def could_match(self, record: CachedMessage) -> bool:
+        """Cheaply rule out a cached record using only the attributes it keeps.
+        Anything that can change after the fact (reactions, pins) is left to `check`.
+        """
+        if self.require == "any":
+            return True  # Any unchecked predicate could still match
+        if self.author and record.author_id != self.author.id:
+            return False
+        if self.mentions and self.mentions.id not in record.mention_ids:
+            return False
+        if self.user_type and record.user_type != self.user_type:
+            return False
+        if self.embeds and not record.flags & CachedMessageFlags.embeds:
+            return False
+        if self.attachments and not record.flags & CachedMessageFlags.attachments:
+            return False
+        if self.emotes and not record.flags & CachedMessageFlags.emotes:
+            return False
+        if self.stickers and not record.flags & CachedMessageFlags.stickers:
+            return False
+        return True
+
+    def _find_cached_matches(
+        self, channel_id: int, cache: MessageCache, matches: list[Message]
+    ) -> tuple[bool, int, datetime | Object | None, datetime | Object | None]:
+        """Answer as much of the search as possible from the cache, adding anything found to `matches`.
+
+        Like the API, a search with `after` goes from oldest to newest, so `limit` keeps the oldest matches.
+        That only works from the cache if it has every message since `after`; otherwise it's skipped.
+
+        Returns:
+            tuple[bool, int, datetime | Object | None, datetime | Object | None]: Whether the search is already
+                finished, how many messages were searched, and the `before`/`after` the API should pick up from.
+        """
+        before: datetime | Object | None = self.before
+        after: datetime | Object | None = self.after
+        oldest_first = self.after is not None
+        if oldest_first and not cache.covers(channel_id, self.after):
+            return False, 0, before, after
+        # Reactions and pins can change after the fact, and only the client's own cache keeps up with that
+        live = cache.resolver() if self.reactions or self.pinned else None
+        searched = 0
+        for record in cache.history(
+            channel_id, before=self.before, after=self.after, oldest_first=oldest_first
+        ):
+            if (self.limit and len(matches) >= self.limit) or (
+                self.search_limit and searched >= self.search_limit
+            ):
+                return True, searched, before, after
+            if self.could_match(record):
+                if not (
+                    message := record.message if live is None else live.get(record.id)
+                ):
+                    return False, searched, before, after
+                if self.check(message):
+                    matches.append(message)
+            searched += 1
+            if oldest_first:
+                after = Object(record.id)
+            else:
+                before = Object(record.id)
+        # Newest first, the API still has to cover whatever is older than the cache
+        return oldest_first, searched, before, after
+
+    async def find_matches(
+        self, channel: "MessageableChannel", cache: MessageCache | None = None
+    ) -> list[Message]:
         matches: list[Message] = []
+        searched = 0
+        before: datetime | Object | None = self.before
+        after: datetime | Object | None = self.after
+
+        if cache and not self.around:
+            # Answer as much as we can from the cache, then fall back to the API for the rest.
+            done, searched, before, after = self._find_cached_matches(
+                channel.id, cache, matches
+            )
+            if done:
+                return matches
 
         async for message in channel.history(
-            limit=self.search_limit,
-            before=self.before,
-            after=self.after,
+            limit=self.search_limit and self.search_limit - searched,
+            before=before,
+            after=after,
             around=self.around,
         ):
             if self.limit and len(matches) >= self.limit:
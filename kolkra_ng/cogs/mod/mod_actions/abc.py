@@ -1,9 +1,11 @@
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
 from beanie.odm.queries.find import FindMany
-from beanie.operators import Eq
+from beanie.operators import Eq, In
 from discord import Embed, Member
 from discord.utils import format_dt, utcnow
 from pydantic import BaseModel, Field
@@ -18,6 +20,11 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+BULK_CONCURRENCY = 5
+"""How many API calls to have in flight at once when acting on many targets.
+discord.py already waits out per-route rate limits, so this just keeps us from queueing up hundreds of requests.
+"""
+
 
 class ModActionLift(BaseModel):
     lifter_id: int
@@ -45,6 +52,8 @@ class ModAction(KolkraDocument, ABC):
     timestamp: UtcDateTime = Field(default_factory=utcnow)
     expiration: UtcDateTime | None = None
     lifted: ModActionLift | None = None
+    log_payload: dict[str, Any] | None = None
+    """The modlog embed as last rendered by `render_log_payload`, so listing actions doesn't have to rebuild it."""
 
     @classmethod
     @abstractmethod
@@ -99,10 +108,23 @@ class ModAction(KolkraDocument, ABC):
         pass
 
     async def log_embed(self) -> Embed:
-        """Adds specific details to a base embed to post in the modlog.
+        """The embed to post in the modlog. Built from `log_payload` if it's been rendered, or from scratch if not.
 
-        Args:
-            bot (Kolkra): The bot instance to use.
+        Returns:
+            Embed: The final embed.
+        """
+        if self.log_payload is None:
+            return await self.render_log_embed()
+        return Embed.from_dict(self.log_payload)
+
+    async def render_log_payload(self) -> None:
+        """Renders the modlog embed into `log_payload`, without saving it.
+        Call this whenever the action is created or lifted, so the stored embed stays current.
+        """
+        self.log_payload = dict((await self.render_log_embed()).to_dict())
+
+    async def render_log_embed(self) -> Embed:
+        """Adds specific details to a base embed to post in the modlog.
 
         Returns:
             Embed: The final embed.
@@ -140,6 +162,17 @@ class ModAction(KolkraDocument, ABC):
             expires=self.expiration,
         )
 
+    async def after_create(self) -> None:
+        """Called once after the action is first saved, before the target is DMed.
+        Subclasses may override this to keep derived data up to date.
+        """
+
+    async def undo_create(self) -> None:
+        """Deletes an action that failed to apply, undoing `after_create`.
+        Subclasses that override `after_create` should override this too.
+        """
+        await self.delete()
+
     @abstractmethod
     async def apply(self, cog: "ModCog") -> None:
         """Do whatever needs to be done to apply the restriction.
@@ -150,6 +183,31 @@ class ModAction(KolkraDocument, ABC):
         """
         pass
 
+    @classmethod
+    async def apply_many(cls, cog: "ModCog", actions: list[Self]) -> list[Self]:
+        """Apply many actions of this type at once.
+        Subclasses may override this to use a bulk API endpoint where one exists.
+
+        Args:
+            cog (ModCog): The cog triggering the actions.
+            actions (list[Self]): The actions to apply.
+
+        Returns:
+            list[Self]: The actions that failed to apply.
+        """
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+        async def inner(action: Self) -> Self | None:
+            async with semaphore:
+                try:
+                    await action.apply(cog)
+                except Exception as e:
+                    log.warning("Failed to apply %s", action, exc_info=e)
+                    return action
+            return None
+
+        return [a for a in await asyncio.gather(*map(inner, actions)) if a]
+
     @abstractmethod
     async def lift(
         self, cog: "ModCog", author: Member, lift_reason: str | None
@@ -172,3 +230,14 @@ class ModAction(KolkraDocument, ABC):
             Eq(cls.guild_id, guild_id), Eq(cls.target_id, target_id), **kwargs
         )
         return cur if include_lifted else cur.find(Eq(cls.lifted, None))
+
+    @classmethod
+    def fetch_existing_for_many(
+        cls, guild_id: int, target_ids: Iterable[int], **kwargs
+    ) -> FindMany[Self]:
+        return cls.find(
+            Eq(cls.guild_id, guild_id),
+            In(cls.target_id, list(target_ids)),
+            Eq(cls.lifted, None),
+            **kwargs,
+        )
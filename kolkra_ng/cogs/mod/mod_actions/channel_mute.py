@@ -6,7 +6,8 @@ from discord import Color, Embed, Member, PermissionOverwrite
 from typing_extensions import Self
 
 from kolkra_ng.cogs.mod.mod_actions.abc import ModAction
-from kolkra_ng.embeds import icons8
+from kolkra_ng.db_registry import register_model
+from kolkra_ng.embeds import EmbedTemplate, icons8
 from kolkra_ng.utils import audit_log_reason_template
 
 if TYPE_CHECKING:
@@ -20,7 +21,15 @@ MUTE_PERMS = PermissionOverwrite(
     speak=False,
 )
 
+DM_TEMPLATE = EmbedTemplate(
+    color=Color.orange(), title="Channel muted", thumbnail_url=icons8("mute")
+)
+LOG_TEMPLATE = EmbedTemplate(
+    color=Color.orange(), title="Channel mute", thumbnail_url=icons8("mute")
+)
+
 
+@register_model
 class ChannelMute(ModAction):
     channel_id: int
 
@@ -29,18 +38,14 @@ class ChannelMute(ModAction):
         return "mute"
 
     def dm_base(self) -> Embed:
-        return Embed(
-            color=Color.orange(),
-            title="Channel muted",
+        return DM_TEMPLATE.build(
             description=f"You have been muted in <#{self.channel_id}>.\n"
-            "If you feel this was unjustified, you may appeal by DMing <@575252669443211264>.",
-        ).set_thumbnail(url=icons8("mute"))
+            "If you feel this was unjustified, you may appeal by DMing <@575252669443211264>."
+        )
 
     def log_base(self) -> Embed:
-        return (
-            Embed(color=Color.orange(), title="Channel mute")
-            .add_field(name="Channel", value=f"<#{self.channel_id}>")
-            .set_thumbnail(url=icons8("mute"))
+        return LOG_TEMPLATE.build().add_field(
+            name="Channel", value=f"<#{self.channel_id}>"
         )
 
     async def apply(self, cog: "ModCog") -> None:
@@ -1,33 +1,45 @@
+import logging
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
-from discord import Color, Embed, Member
+from discord import Color, Embed, HTTPException, Member
+from typing_extensions import Self
 
 from kolkra_ng.cogs.mod.mod_actions.abc import ModAction
-from kolkra_ng.embeds import icons8
+from kolkra_ng.db_registry import register_model
+from kolkra_ng.embeds import EmbedTemplate, icons8
 from kolkra_ng.utils import audit_log_reason_template
 
 if TYPE_CHECKING:
     from kolkra_ng.cogs.mod import ModCog
 
+log = logging.getLogger(__name__)
 
+MAX_USERS_PER_BULK_BAN = 200
+
+DM_TEMPLATE = EmbedTemplate(
+    color=Color.red(),
+    title="Banned",
+    description="You have been banned from the Splatfest server.\n"
+    "If you feel this was unjustified, please join our ban appeal server for next steps: https://discord.gg/HgjBcmrfa6",
+    thumbnail_url=icons8("law"),
+)
+LOG_TEMPLATE = EmbedTemplate(
+    color=Color.red(), title="Server Ban", thumbnail_url=icons8("law")
+)
+
+
+@register_model
 class ServerBan(ModAction):
     @classmethod
     def noun(cls) -> str:
         return "ban"
 
     def dm_base(self) -> Embed:
-        return Embed(
-            color=Color.red(),
-            title="Banned",
-            description="You have been banned from the Splatfest server.\n"
-            "If you feel this was unjustified, please join our ban appeal server for next steps: https://discord.gg/HgjBcmrfa6",
-        ).set_thumbnail(url=icons8("law"))
+        return DM_TEMPLATE.build()
 
     def log_base(self) -> Embed:
-        return Embed(
-            color=Color.red(),
-            title="Server Ban",
-        ).set_thumbnail(url=icons8("law"))
+        return LOG_TEMPLATE.build()
 
     async def apply(self, cog: "ModCog") -> None:
         await cog.bot.http.ban(
@@ -37,6 +49,49 @@ class ServerBan(ModAction):
             delete_message_seconds=0,
         )
 
+    @classmethod
+    async def apply_many(  # pyright: ignore [reportIncompatibleMethodOverride]
+        cls, cog: "ModCog", actions: list[Self]
+    ) -> list[Self]:
+        by_guild: defaultdict[int, list[Self]] = defaultdict(list)
+        for action in actions:
+            by_guild[action.guild_id].append(action)
+        failed: list[Self] = []
+        for guild_id, guild_actions in by_guild.items():
+            for i in range(0, len(guild_actions), MAX_USERS_PER_BULK_BAN):
+                chunk = guild_actions[i : i + MAX_USERS_PER_BULK_BAN]
+                first = chunk[0]
+                try:
+                    resp = await cog.bot.http.bulk_ban(
+                        guild_id,
+                        user_ids=[a.target_id for a in chunk],
+                        delete_message_seconds=0,
+                        reason=audit_log_reason_template(
+                            author_name=(
+                                user.name
+                                if (user := cog.bot.get_user(first.issuer_id))
+                                else None
+                            ),
+                            author_id=first.issuer_id,
+                            reason=first.reason,
+                            targets=len(chunk),
+                            expires=first.expiration,
+                        ),
+                    )
+                except HTTPException as e:
+                    # Includes the error Discord sends when nobody in the chunk could be banned
+                    log.warning(
+                        "Bulk ban of %d users in guild %s failed",
+                        len(chunk),
+                        guild_id,
+                        exc_info=e,
+                    )
+                    failed.extend(chunk)
+                    continue
+                failed_ids = {int(u) for u in resp.get("failed_users") or []}
+                failed.extend(a for a in chunk if a.target_id in failed_ids)
+        return failed
+
     async def lift(
         self, cog: "ModCog", author: Member, lift_reason: str | None
     ) -> None:
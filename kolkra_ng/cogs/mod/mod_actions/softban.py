@@ -1,36 +1,44 @@
+import contextlib
 from typing import TYPE_CHECKING
 
-from discord import Color, Embed, Member
+from discord import Color, Embed, Member, NotFound
 
 from kolkra_ng.cogs.mod.mod_actions.abc import ModAction
-from kolkra_ng.embeds import icons8
+from kolkra_ng.db_registry import register_model
+from kolkra_ng.embeds import EmbedTemplate, icons8
 
 if TYPE_CHECKING:
     from kolkra_ng.cogs.mod import ModCog
 
+DM_TEMPLATE = EmbedTemplate(
+    color=Color.red(),
+    title="Softbanned",
+    description="This account is no longer permitted to participate in the Splatfest server.\n"
+    "If you feel this was unjustified, please join our ban appeal server for next steps: https://discord.gg/HgjBcmrfa6",
+    thumbnail_url=icons8("no-entry"),
+)
+LOG_TEMPLATE = EmbedTemplate(
+    color=Color.red(), title="Softban", thumbnail_url=icons8("no-entry")
+)
 
+
+@register_model
 class Softban(ModAction):
     @classmethod
     def noun(cls) -> str:
         return "softban"
 
     def dm_base(self) -> Embed:
-        return Embed(
-            color=Color.red(),
-            title="Softbanned",
-            description="This account is no longer permitted to participate in the Splatfest server.\n"
-            "If you feel this was unjustified, please join our ban appeal server for next steps: https://discord.gg/HgjBcmrfa6",
-        ).set_thumbnail(url=icons8("no-entry"))
+        return DM_TEMPLATE.build()
 
     def log_base(self) -> Embed:
-        return Embed(color=Color.red(), title="Softban").set_thumbnail(
-            url=icons8("no-entry")
-        )
+        return LOG_TEMPLATE.build()
 
     async def apply(self, cog: "ModCog") -> None:
-        return await cog.bot.http.kick(
-            self.target_id, self.guild_id, self.apply_audit_reason(cog.bot)
-        )
+        with contextlib.suppress(NotFound):  # Already gone--the softban still stands
+            await cog.bot.http.kick(
+                self.target_id, self.guild_id, self.apply_audit_reason(cog.bot)
+            )
 
     async def lift(
         self, cog: "ModCog", author: Member, lift_reason: str | None
@@ -1,14 +1,18 @@
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 import humanize
+from beanie import Document
+from beanie.operators import Eq
 from discord import Color, Embed, Member
 from pydantic import PrivateAttr
+from pymongo import ASCENDING, IndexModel, ReturnDocument, UpdateOne
 
 from kolkra_ng.bot import Kolkra
 from kolkra_ng.cogs.mod.mod_actions.abc import ModAction
 from kolkra_ng.cogs.mod.mod_actions.server_ban import ServerBan
-from kolkra_ng.embeds import icons8
+from kolkra_ng.db_registry import register_model
+from kolkra_ng.embeds import EmbedTemplate, icons8
 
 if TYPE_CHECKING:
     from kolkra_ng.cogs.mod import ModCog
@@ -16,7 +20,93 @@ log = logging.getLogger(__name__)
 
 BAN_WARNINGS = 5
 
+DM_TEMPLATE = EmbedTemplate(
+    title="Warning",
+    description="You have been issued a warning in the Splatfest server.",
+    color=Color.yellow(),
+    thumbnail_url=icons8("error"),
+)
+LOG_TEMPLATE = EmbedTemplate(
+    title="Warning", color=Color.yellow(), thumbnail_url=icons8("error")
+)
 
+
+@register_model
+class WarningCount(Document):
+    """A materialized count of a user's active warnings, kept in step with warning inserts/lifts."""
+
+    class Settings:
+        name = "warning_counts"
+        indexes: ClassVar = [
+            IndexModel([("guild_id", ASCENDING), ("target_id", ASCENDING)], unique=True)
+        ]
+
+    guild_id: int
+    target_id: int
+    active_warnings: int = 0
+
+    @classmethod
+    async def increment(cls, guild_id: int, target_id: int, by: int = 1) -> int:
+        """Atomically adjust a user's warning count.
+
+        Returns:
+            int: The count after the update.
+        """
+        doc = await cls.get_motor_collection().find_one_and_update(
+            {"guild_id": guild_id, "target_id": target_id},
+            {"$inc": {"active_warnings": by}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return doc["active_warnings"]
+
+    @classmethod
+    async def get_count(cls, guild_id: int, target_id: int) -> int:
+        doc = await cls.find_one(
+            Eq(cls.guild_id, guild_id), Eq(cls.target_id, target_id)
+        )
+        return doc.active_warnings if doc else 0
+
+    @classmethod
+    async def rebuild(cls) -> None:
+        """Recount every user's active warnings from scratch.
+
+        Counts are overwritten in place rather than dropped and reinserted, so there's never a moment where they're missing.
+        A warning issued or lifted while this runs can still leave its user's count off by one, so this is meant as a
+        backfill/repair tool rather than something to run routinely.
+        """
+        counts = await (
+            ModWarning.find(Eq(ModWarning.lifted, None))
+            .aggregate(
+                [
+                    {
+                        "$group": {
+                            "_id": {"guild_id": "$guild_id", "target_id": "$target_id"},
+                            "count": {"$sum": 1},
+                        }
+                    }
+                ]
+            )
+            .to_list()
+        )
+        counted = {(c["_id"]["guild_id"], c["_id"]["target_id"]) for c in counts}
+        updates = [
+            UpdateOne(c["_id"], {"$set": {"active_warnings": c["count"]}}, upsert=True)
+            for c in counts
+        ]
+        async for stale in cls.get_motor_collection().find(
+            {"active_warnings": {"$ne": 0}}, {"guild_id": 1, "target_id": 1}
+        ):
+            if (stale["guild_id"], stale["target_id"]) not in counted:
+                updates.append(
+                    UpdateOne({"_id": stale["_id"]}, {"$set": {"active_warnings": 0}})
+                )
+        if updates:
+            await cls.get_motor_collection().bulk_write(updates, ordered=False)
+        log.info("Rebuilt warning counts for %s users", len(counts))
+
+
+@register_model
 class ModWarning(ModAction):
     _count: int = PrivateAttr(
         default=None
@@ -24,21 +114,22 @@ class ModWarning(ModAction):
 
     async def cached_count(self, refresh: bool = False) -> int:
         if self._count is None or refresh:
-            self._count = await self.fetch_existing_for(
-                self.guild_id, self.target_id
-            ).count()
+            self._count = await WarningCount.get_count(self.guild_id, self.target_id)
         return self._count
 
+    async def after_create(self) -> None:
+        self._count = await WarningCount.increment(self.guild_id, self.target_id)
+
+    async def undo_create(self) -> None:
+        self._count = await WarningCount.increment(self.guild_id, self.target_id, -1)
+        await super().undo_create()
+
     @classmethod
     def noun(cls) -> str:
         return "warning"
 
     def dm_base(self) -> Embed:
-        return Embed(
-            title="Warning",
-            description="You have been issued a warning in the Splatfest server.",
-            color=Color.yellow(),
-        ).set_thumbnail(url=icons8("error"))
+        return DM_TEMPLATE.build()
 
     async def dm_embed(self, bot: Kolkra) -> Embed:
         count = await self.cached_count()
@@ -66,13 +157,11 @@ class ModWarning(ModAction):
         return embed
 
     def log_base(self) -> Embed:
-        return Embed(title="Warning", color=Color.yellow()).set_thumbnail(
-            url=icons8("error")
-        )
+        return LOG_TEMPLATE.build()
 
-    async def log_embed(self) -> Embed:
+    async def render_log_embed(self) -> Embed:
         count = await self.cached_count()
-        embed = (await super().log_embed()).add_field(
+        embed = (await super().render_log_embed()).add_field(
             name="Warning count",
             value=f"{'⚠️' * count} {humanize.ordinal(count)} warning",
         )
@@ -91,7 +180,8 @@ class ModWarning(ModAction):
     async def apply(self, cog: "ModCog") -> None:
         count = await self.cached_count()
         if count >= BAN_WARNINGS:
-            await cog.do_apply(
+            # Applied separately, so a failed ban doesn't roll back the warning that triggered it
+            cog.apply_later(
                 ServerBan(
                     issuer_id=cog.bot.user.id,  # pyright: ignore [reportOptionalMemberAccess]
                     target_id=self.target_id,
@@ -105,4 +195,5 @@ class ModWarning(ModAction):
     async def lift(
         self, cog: "ModCog", author: Member, lift_reason: str | None
     ) -> None:
-        pass  # It's just a warning--there's nothing we need to do guild-side.
+        # It's just a warning--there's nothing we need to do guild-side.
+        self._count = await WarningCount.increment(self.guild_id, self.target_id, -1)
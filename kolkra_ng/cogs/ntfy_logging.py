@@ -22,7 +22,6 @@ from pydantic import (
 )
 from pydantic_core import Url
 from pydantic_extra_types.phone_numbers import PhoneNumber
-from wonderwords.random_word import RandomWord
 
 from kolkra_ng.bot import Kolkra
 from kolkra_ng.utils import validate_by_input_type
@@ -110,6 +109,8 @@ def random_topic() -> Secret[str]:
     Returns:
         Secret[str]: A random topic string, wrapped in a Pydantic secret to prevent accidental logging.
     """
+    from wonderwords.random_word import RandomWord
+
     pool = RandomWord()
     result = "-".join(pool.random_words(4))
     log.warning(
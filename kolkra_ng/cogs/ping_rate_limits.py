@@ -6,7 +6,7 @@ from typing import Annotated, Any
 import humanize
 from beanie import Indexed
 from beanie.operators import Eq, In
-from discord import Member, Message, Role
+from discord import HTTPException, Member, Message, Role
 from discord.ext import commands
 from discord.utils import format_dt, utcnow
 from typing_extensions import Self
@@ -14,6 +14,7 @@ from typing_extensions import Self
 from kolkra_ng.bot import Kolkra, KolkraContext
 from kolkra_ng.checks import is_staff_level
 from kolkra_ng.converters import Flags, TimeDeltaConverter
+from kolkra_ng.db_registry import register_model
 from kolkra_ng.db_types import KolkraDocument, RoleRepr
 from kolkra_ng.embeds import (
     AccessDeniedEmbed,
@@ -46,6 +47,7 @@ class Alias:
         setattr(obj, self.source_name, value)
 
 
+@register_model
 class PingRateLimit(KolkraDocument):
     """A Beanie representation of a rate limit with methods borrowed from `commands.Cooldown`.
     I'm so sorry...
@@ -119,7 +121,7 @@ class PingRateLimitsCog(commands.Cog):
         self.reset_tasks: dict[RoleRepr, asyncio.Task[None]] = {}
 
     async def cog_load(self) -> None:
-        await self.bot.init_db_models(PingRateLimit)
+        await self.bot.init_db_models()
         async for rl in PingRateLimit.find_all():
             self.setup_reset(rl)
 
@@ -173,6 +175,36 @@ class PingRateLimitsCog(commands.Cog):
             )
         await message.reply(embeds=split_embed.embeds())
 
+    async def resolve_role(
+        self, rl: PingRateLimit, gone: list[PingRateLimit] | None = None
+    ) -> Role | None:
+        """Looks up a rate-limited role, logging why if it can't be found.
+
+        Args:
+            rl (PingRateLimit): The rate limit to look up the role of.
+            gone (list[PingRateLimit] | None, optional): Where to collect rate limits whose role no longer exists,
+                so they can be deleted. Defaults to None.
+
+        Returns:
+            Role | None: The role, or None if it's gone or couldn't be looked up right now.
+        """
+        try:
+            role = await rl.role_repr.get(self.bot)
+        except HTTPException as e:
+            log.warning(
+                "Couldn't look up role %s, skipping its rate limit",
+                rl.role_repr,
+                exc_info=e,
+            )
+            return None
+        if not role and gone is not None:
+            log.info(
+                "Role %s doesn't seem to exist anymore--rate limit marked for deletion.",
+                rl.role_repr,
+            )
+            gone.append(rl)
+        return role
+
     @commands.Cog.listener()
     async def on_message(self, message: Message) -> None:
         if not message.guild:
@@ -182,12 +214,7 @@ class PingRateLimitsCog(commands.Cog):
         async for rl in PingRateLimit.find(
             Eq(PingRateLimit.role_repr.guild_id, message.guild.id)
         ):
-            if not (role := await rl.role_repr.get(self.bot)):
-                log.info(
-                    "Role %s doesn't seem to exist anymore--rate limit marked for deletion.",
-                    rl.role_repr,
-                )
-                to_delete.append(rl)
+            if not (role := await self.resolve_role(rl, to_delete)):
                 continue
             if role in message.role_mentions:
                 rl.update_rate_limit()
@@ -224,7 +251,7 @@ class PingRateLimitsCog(commands.Cog):
         async for limit in PingRateLimit.find(
             Eq(PingRateLimit.role_repr.guild_id, ctx.guild.id)
         ):
-            if not (role := await limit.role_repr.get(ctx.bot)):
+            if not (role := await self.resolve_role(limit)):
                 continue
 
             per = humanize.precisedelta(int(limit.per))
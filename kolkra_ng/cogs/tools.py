@@ -1,29 +1,145 @@
-import ipaddress
+import asyncio
+import logging
 import random
+import time
+from collections import defaultdict
+from collections.abc import Collection, Sequence
+from contextlib import suppress
 from datetime import datetime
 from hashlib import sha256
+from ipaddress import IPv4Address, IPv4Network
+from itertools import combinations
 from typing import Any
 
 import pint
 from discord import Message, TextChannel, Thread, VoiceChannel
 from discord.ext import commands
 from discord.utils import TimestampStyle, format_dt, utcnow
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel, field_validator
 
 from kolkra_ng.bot import Kolkra, KolkraContext
-from kolkra_ng.converters import DatetimeConverter, Flags, SimpleConverter
-from kolkra_ng.embeds import ErrorEmbed, OkEmbed
+from kolkra_ng.converters import (
+    DatetimeConverter,
+    Flags,
+    SimpleConverter,
+    run_blocking,
+)
+from kolkra_ng.embeds import ErrorEmbed, InfoEmbed, OkEmbed, SplitEmbed
+from kolkra_ng.units import ConversionTable, conversion_table
+from kolkra_ng.views.pager import Pager, group_embeds
 
+log = logging.getLogger(__name__)
+
+# Roughly how long the convert command may spend converting, in seconds
+CONVERT_BUDGET = 0.5
+
+
+class NoLanIpsLeft(commands.BadArgument):
+    def __init__(self, in_lobby: bool = False) -> None:
+        super().__init__(
+            "Every LAN IP has already been handed out in this channel."
+            if in_lobby
+            else "There are no LAN IPs left to pick from."
+        )
+
+
+class NoLanSubnets(ValueError):
+    def __init__(self) -> None:
+        super().__init__("at least one subnet is required")
+
+
+class OverlappingLanSubnets(ValueError):
+    def __init__(self, a: IPv4Network, b: IPv4Network) -> None:
+        super().__init__(f"subnets must not overlap, but {a} and {b} do")
+
+
+def usable_hosts(network: IPv4Network) -> range:
+    """The integer range of assignable addresses in a network, i.e. without its network and broadcast addresses."""
+    first, last = int(network.network_address), int(network.broadcast_address)
+    if network.prefixlen < 31:
+        first, last = first + 1, last - 1
+    return range(first, last + 1)
+
+
+def pick_lan_ip(
+    seed: Any = None,
+    subnets: Sequence[IPv4Network] = (IPv4Network("10.13.0.0/16"),),
+    exclude: Collection[IPv4Address] = (
+        IPv4Address("10.13.37.1"),  # The gateway IP in a LAN play setup.
+    ),
+) -> IPv4Address:
+    """Pick an assignable address uniformly at random from one or more non-overlapping subnets, skipping some.
+
+    Works on the integer ranges directly, so there's no need to list out (or retry over) the addresses.
+
+    Args:
+        seed (Any, optional): Seed for the random choice, for deterministic results. Defaults to None.
+        subnets (Sequence[IPv4Network], optional): Where to pick from. Defaults to LAN play's 10.13.0.0/16.
+        exclude (Collection[IPv4Address], optional): Addresses that must not be picked. Defaults to LAN play's gateway.
+
+    Raises:
+        NoLanIpsLeft: There are no addresses left to pick from.
+
+    Returns:
+        IPv4Address: The picked address.
+    """
+    ranges = [usable_hosts(subnet) for subnet in subnets]
+    excluded = sorted({int(ip) for ip in exclude if any(int(ip) in r for r in ranges)})
+    if (available := sum(map(len, ranges)) - len(excluded)) <= 0:
+        raise NoLanIpsLeft()
+    index = random.Random(seed).randrange(available)
+    for r in ranges:
+        skipped = [ip for ip in excluded if ip in r]
+        if index >= len(r) - len(skipped):
+            index -= len(r) - len(skipped)
+            continue
+        # Shift past every excluded address at or below the pick, so they're never returned
+        ip = r.start + index
+        for excluded_ip in skipped:
+            if excluded_ip > ip:
+                break
+            ip += 1
+        return IPv4Address(ip)
+    raise AssertionError("unreachable")
+
+
+class ToolsConfig(BaseModel):
+    lan_subnets: list[IPv4Network] = [IPv4Network("10.13.0.0/16")]
+    lan_reserved: list[IPv4Address] = [IPv4Address("10.13.37.1")]
+    # Where pint caches its parsed unit definitions between runs; ":auto:" is the user cache directory, None disables it
+    unit_cache_folder: str | None = ":auto:"
+
+    @field_validator("lan_subnets", mode="after")
+    @classmethod
+    def validate_lan_subnets(cls, value: list[IPv4Network]) -> list[IPv4Network]:
+        if not value:
+            raise NoLanSubnets()
+        for a, b in combinations(value, 2):
+            if a.overlaps(b):
+                raise OverlappingLanSubnets(a, b)
+        return value
 
-def pick_lan_ip(seed: Any = None) -> ipaddress.IPv4Address:
-    ip = random.Random(seed).choice(
-        list(ipaddress.IPv4Network("10.13.0.1/16", strict=False))
-    )
 
-    # 10.13.37.1 is the gateway IP in a LAN play setup.
-    if ip == ipaddress.IPv4Address("10.13.37.1"):
-        return pick_lan_ip()
+class LanLobby:
+    """The IPs handed out in one LAN play lobby (channel) this session, so nobody in it gets a duplicate."""
 
-    return ip
+    def __init__(self) -> None:
+        self.assigned: dict[int, IPv4Address] = {}
+
+    def assign(
+        self, user_id: int, config: ToolsConfig, seed: Any = None
+    ) -> IPv4Address:
+        if (ip := self.assigned.get(user_id)) is None:
+            try:
+                ip = self.assigned[user_id] = pick_lan_ip(
+                    seed,
+                    config.lan_subnets,
+                    {*config.lan_reserved, *self.assigned.values()},
+                )
+            except NoLanIpsLeft as e:
+                raise NoLanIpsLeft(in_lobby=True) from e
+        return ip
 
 
 class RandomLanIpFlags(Flags):
@@ -32,26 +148,64 @@ class RandomLanIpFlags(Flags):
         aliases=["s", "deterministic", "d"],
         description="Generate your IP deterministically based on your user ID to avoid collisions.",
     )
+    unique: bool = commands.flag(
+        default=False,
+        aliases=["u", "lobby"],
+        description="Get an IP nobody else in this channel has been given since the bot started.",
+    )
 
 
-class QuantityConverter(SimpleConverter[pint.Quantity]):
-    async def parse(self, argument: str, *, bot: Kolkra) -> pint.Quantity:
-        return bot.typed_get_cog(
+class QuantityConverter(SimpleConverter[PlainQuantity]):
+    async def parse(self, argument: str, *, bot: Kolkra) -> PlainQuantity:
+        conversions = await bot.typed_get_cog(
             ToolsCog
-        ).ureg.Quantity(  # pyright: ignore [reportOptionalMemberAccess, reportReturnType]
-            argument
-        )
+        ).get_conversions()  # pyright: ignore [reportOptionalMemberAccess]
+        return await run_blocking(conversions.parse, argument)
 
-    async def generate_autocomplete(self, value: pint.Quantity, *, bot: Kolkra) -> str:
+    async def generate_autocomplete(self, value: PlainQuantity, *, bot: Kolkra) -> str:
         return f"{value:P}"
 
+    async def generate_suggestions(
+        self, argument: str, value: PlainQuantity, *, bot: Kolkra
+    ) -> list[str]:
+        suggestions = [await self.generate_autocomplete(value, bot=bot), f"{value:~P}"]
+        with suppress(pint.PintError):
+            suggestions.append(f"{value.to_compact():~P}")
+        return suggestions
+
 
 class ToolsCog(commands.Cog):
     def __init__(self, bot: Kolkra) -> None:
         super().__init__()
         self.bot = bot
-        self.ureg = pint.UnitRegistry(
-            autoconvert_offset_to_baseunit=True, default_as_delta=False
+        self.config = ToolsConfig(**bot.config.cogs.get(self.__cog_name__, {}))
+        self.lan_lobbies: defaultdict[int, LanLobby] = defaultdict(LanLobby)
+        self.warm_up_task: asyncio.Task[ConversionTable] | None = None
+
+    def warm_up(self) -> "asyncio.Task[ConversionTable]":
+        """Start building the conversion table in a worker thread, unless that's already underway or done."""
+        task = self.warm_up_task
+        if task is None or (task.done() and (task.cancelled() or task.exception())):
+            task = self.warm_up_task = asyncio.create_task(
+                asyncio.to_thread(conversion_table, self.config.unit_cache_folder)
+            )
+        return task
+
+    async def get_conversions(self) -> ConversionTable:
+        """Get the conversion table, waiting for it to be built if need be.
+
+        This never blocks the event loop on pint, nor on the lock in `conversion_table` while the warm-up holds it.
+        """
+        # Shielded, since autocomplete cancels whatever it's given up on
+        return await asyncio.shield(self.warm_up())
+
+    async def cog_load(self) -> None:
+        # Build the unit registry in the background rather than holding up startup, or the first convert, for it
+        start = time.perf_counter()
+        self.warm_up().add_done_callback(
+            lambda _: log.info(
+                "Unit registry ready %.2fs after loading", time.perf_counter() - start
+            )
         )
 
     @commands.hybrid_command(aliases=["lanip"])
@@ -65,10 +219,23 @@ class ToolsCog(commands.Cog):
             if flags.seeded
             else None
         )
+        try:
+            ip = (
+                self.lan_lobbies[ctx.channel.id].assign(
+                    ctx.author.id, self.config, seed
+                )
+                if flags.unique
+                else pick_lan_ip(
+                    seed, self.config.lan_subnets, self.config.lan_reserved
+                )
+            )
+        except NoLanIpsLeft as e:
+            await ctx.respond(embed=ErrorEmbed(description=str(e)), ephemeral=True)
+            return
         await ctx.respond(
             embed=OkEmbed(
                 title="Random LAN IP",
-                description=f"Your LAN IP is {pick_lan_ip(seed)}",
+                description=f"Your LAN IP is {ip}",
             ),
             ephemeral=True,
         )
@@ -125,16 +292,29 @@ class ToolsCog(commands.Cog):
         self,
         ctx: KolkraContext,
         *,
-        quantity: pint.Quantity = commands.parameter(converter=QuantityConverter()),
+        quantity: PlainQuantity = commands.parameter(converter=QuantityConverter()),
     ) -> None:
         """Convert a measurement into several different units.
         Input is parsed and converted using the [pint](https://pint.readthedocs.io/en/stable/getting/tutorial.html#string-parsing) library.
         """
-        pq = self.ureg.Quantity(quantity)
-        results = "\n".join(f"- {pq.to(u):~P}" for u in pq.compatible_units())
-        await ctx.respond(
-            embed=OkEmbed(description=f"{pq:~P} is equivalent to:\n{results}")
+        conversions, complete = (await self.get_conversions()).convert(
+            quantity, CONVERT_BUDGET
+        )
+        if not conversions and complete:
+            await ctx.respond(
+                embed=InfoEmbed(
+                    title="No conversions available",
+                    description=f"There's nothing to convert {quantity:~P} into.",
+                )
+            )
+            return
+        results = "\n".join(f"- {q:~P}" for q in conversions)
+        if not complete:
+            results += "\n- *...and more, but that took too long to work out.*"
+        split_embed = SplitEmbed.from_single(
+            OkEmbed(description=f"{quantity:~P} is equivalent to:\n{results}")
         )
+        await Pager(group_embeds(split_embed.embeds()), ctx.author).respond(ctx)
 
 
 async def setup(bot: Kolkra) -> None:
@@ -1,12 +1,14 @@
+import asyncio
 import logging
 import random
 
 from discord import Member, Thread
 from discord.ext import commands
 from discord.utils import escape_markdown
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, PositiveFloat, PositiveInt
 
 from kolkra_ng.bot import Kolkra
+from kolkra_ng.utils import SlidingWindowCounter
 from kolkra_ng.webhooks import SupportsWebhooks
 
 log = logging.getLogger(__name__)
@@ -37,6 +39,18 @@ class WelcomeConfig(BaseModel):
             "<a:1member:803768545816084480> <:splatbroke:1057109111097004103>"
         ],
     )
+    burst_threshold: PositiveInt = Field(
+        default=10,
+        description="How many joins within burst_window seconds switch welcomes to batched mode.",
+    )
+    burst_window: PositiveFloat = 60
+    batch_interval: PositiveFloat = Field(
+        default=30,
+        description="How often, in seconds, to post batched welcomes during a join burst.",
+    )
+
+
+MAX_MESSAGE_LENGTH = 2000
 
 
 class WelcomeCog(commands.Cog):
@@ -46,6 +60,9 @@ class WelcomeCog(commands.Cog):
         super().__init__()
         self.bot = bot
         self.config = WelcomeConfig(**bot.config.cogs.get(self.__cog_name__, {}))
+        self.join_rate = SlidingWindowCounter(self.config.burst_window)
+        self.pending_joins: list[Member] = []
+        self.flush_task: asyncio.Task[None] | None = None
 
     async def cog_load(self) -> None:
         self.channel = await self.bot.fetch_channel(
@@ -54,17 +71,71 @@ class WelcomeCog(commands.Cog):
         if not isinstance(self.channel, SupportsWebhooks | Thread):
             log.warn("Configured channel %s does not support webhooks!", self.channel)
 
-    @commands.Cog.listener()
-    async def on_member_join(self, member: Member) -> None:
+    async def cog_unload(self) -> None:
+        if self.flush_task:
+            self.flush_task.cancel()
+        # Whoever's still waiting for the next batch would otherwise never get welcomed
+        await self.flush_joins()
+
+    @property
+    def bursting(self) -> bool:
+        return self.join_rate.count() >= self.config.burst_threshold
+
+    async def send_welcome(self, mentions: str, guild_name: str) -> None:
         await self.bot.webhooks.send(
             self.channel,
             random.choice(self.config.on_join.messages).format(
-                user=member.mention, guild=member.guild.name
+                user=mentions, guild=guild_name
             ),
             avatar_url=self.config.on_join.icon,
             username="`",
         )
 
+    async def flush_joins(self) -> None:
+        """Welcome everyone who joined since the last flush in as few messages as possible."""
+        members, self.pending_joins = self.pending_joins, []
+        if not members:
+            return
+        # Leave room for the template around the mentions
+        budget = MAX_MESSAGE_LENGTH - max(map(len, self.config.on_join.messages)) - 100
+        batch: list[str] = []
+        length = 0
+        for member in members:
+            if batch and length + len(member.mention) + 2 > budget:
+                await self.send_welcome(", ".join(batch), member.guild.name)
+                batch, length = [], 0
+            batch.append(member.mention)
+            length += len(member.mention) + 2
+        await self.send_welcome(", ".join(batch), members[0].guild.name)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.batch_interval)
+            # Shielded so an unload mid-flush doesn't drop the members this flush already took off the queue
+            await asyncio.shield(self.flush_joins())
+            if not self.bursting:
+                log.info("Join burst over, going back to individual welcomes")
+                return
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: Member) -> None:
+        joins = self.join_rate.hit()
+        # Other cogs can listen for `on_join_rate_update` to react to raids.
+        self.bot.dispatch("join_rate_update", joins, self.config.burst_window)
+        if joins < self.config.burst_threshold and not (
+            self.flush_task and not self.flush_task.done()
+        ):
+            await self.send_welcome(member.mention, member.guild.name)
+            return
+        self.pending_joins.append(member)
+        if not self.flush_task or self.flush_task.done():
+            log.info(
+                "Join burst detected (%s joins in %ss), batching welcomes",
+                joins,
+                self.config.burst_window,
+            )
+            self.flush_task = self.bot.loop.create_task(self._flush_periodically())
+
     @commands.Cog.listener()
     async def on_member_remove(self, member: Member) -> None:
         await self.bot.webhooks.send(
@@ -0,0 +1,54 @@
+"""A trigram index over command names and aliases for fast "did you mean" suggestions."""
+
+from collections import defaultdict
+from collections.abc import Mapping
+from difflib import SequenceMatcher
+
+from discord.ext import commands
+
+
+def trigrams(s: str) -> set[str]:
+    s = f"  {s.casefold()} "
+    return {s[i : i + 3] for i in range(len(s) - 2)}
+
+
+class CommandIndex:
+    """Maps every command name/alias to its command, with a trigram index for fuzzy lookups.
+
+    The trigram index only narrows down the candidates; they're ranked the same way `difflib.get_close_matches` would,
+    we just don't compare against every name on every typo.
+    """
+
+    def __init__(self, all_commands: Mapping[str, commands.Command]) -> None:
+        self.names = dict(all_commands)
+        self._postings: defaultdict[str, set[str]] = defaultdict(set)
+        for name in self.names:
+            for gram in trigrams(name):
+                self._postings[gram].add(name)
+
+    def suggest(
+        self, query: str, cutoff: float = 0.6
+    ) -> list[tuple[str, commands.Command]]:
+        """Find names similar to a query, most similar first.
+
+        Args:
+            query (str): The (probably misspelled) name to look up.
+            cutoff (float, optional): The minimum similarity ratio to consider a match. Defaults to 0.6.
+
+        Returns:
+            list[tuple[str, commands.Command]]: Matching names and the commands they belong to.
+        """
+        candidates: set[str] = set()
+        for gram in trigrams(query):
+            candidates.update(self._postings.get(gram, ()))
+        matcher = SequenceMatcher(b=query)
+        scored = []
+        for name in candidates:
+            matcher.set_seq1(name)
+            if (
+                matcher.real_quick_ratio() >= cutoff
+                and matcher.quick_ratio() >= cutoff
+                and (score := matcher.ratio()) >= cutoff
+            ):
+                scored.append((score, name))
+        return [(name, self.names[name]) for _, name in sorted(scored, reverse=True)]
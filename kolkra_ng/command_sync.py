@@ -0,0 +1,36 @@
+"""Remembers what application commands were last synced, so unchanged trees don't have to be synced again."""
+
+import hashlib
+import json
+from typing import Annotated
+
+from beanie import Document, Indexed
+from discord import app_commands
+from discord.abc import Snowflake
+
+from kolkra_ng.db_registry import register_model
+
+
+@register_model
+class CommandTreeState(Document):
+    class Settings:
+        name = "command_tree_state"
+
+    guild_id: Annotated[int, Indexed(unique=True)]
+    payload_hash: str
+
+
+def tree_hash(tree: app_commands.CommandTree, guild: Snowflake) -> str:
+    """Hash the payload that syncing a guild's application commands would send.
+
+    Returns:
+        str: A hex digest that only changes when the commands (as Discord sees them) do.
+    """
+    # Extensions load concurrently, so the order commands were added in isn't stable
+    payload = sorted(
+        (cmd.to_dict(tree) for cmd in tree.get_commands(guild=guild)),
+        key=lambda c: (c.get("type", 1), c["name"]),
+    )
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()
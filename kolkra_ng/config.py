@@ -42,6 +42,8 @@ class Config(BaseModel):
     staff_roles: dict[StaffLevel, StaffRoles]
     named_roles: dict[str, int] = Field(default_factory=dict)
     cogs: dict[str, dict[str, Any]] = Field(default_factory=dict)
+    # Modules (e.g. "cogs.translate") to load in the background once the bot is ready, instead of during startup
+    lazy_modules: list[str] = Field(default_factory=list)
     devs: list[int] | None = None
 
     @field_validator("bot_token", mode="after")
@@ -1,17 +1,35 @@
+import asyncio
 import logging
+import re
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Generic, Literal, TypeVar
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import cache
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Generic,
+    Literal,
+    TypeAlias,
+    TypeVar,
+)
 
-import dateparser
 import emoji
 import pytimeparse
 from discord import Interaction, app_commands
 from discord.ext import commands
+from discord.utils import utcnow
+from typing_extensions import TypeVarTuple, Unpack
 
 from kolkra_ng.bot import Kolkra
 from kolkra_ng.context import KolkraContext
 
+if TYPE_CHECKING:
+    from dateparser.date import DateDataParser
+
 log = logging.getLogger(__name__)
 
 
@@ -20,9 +38,41 @@ class Flags(commands.FlagConverter):
 
 
 T = TypeVar("T")
+ArgsT = TypeVarTuple("ArgsT")
+
+# Discord gives autocomplete 3 seconds to respond; anything slower than this is dropped
+AUTOCOMPLETE_BUDGET = 1.5
+AUTOCOMPLETE_CACHE_SIZE = 256
+MAX_CHOICES = 25
+BLOCKING_PARSE_WORKERS = 2
+
+_blocking_parse_executor = ThreadPoolExecutor(
+    max_workers=BLOCKING_PARSE_WORKERS, thread_name_prefix="blocking-parse"
+)
+
+
+async def run_blocking(func: Callable[[Unpack[ArgsT]], T], *args: Unpack[ArgsT]) -> T:
+    """Run a CPU-bound, synchronous parser without blocking the event loop.
+
+    Parsers get a small pool of their own, so inputs that blow the autocomplete budget queue up there instead of
+    tying up threads elsewhere. If the caller gives up before the work has started, it's dropped.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _blocking_parse_executor, func, *args
+    )
 
 
 class SimpleConverter(commands.Converter[T], app_commands.Transformer, Generic[T], ABC):
+    autocomplete_ttl: ClassVar[float] = 60
+    """How long autocomplete suggestions for an input are reused, in seconds."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._autocomplete_cache: OrderedDict[str, tuple[float, list[str]]] = (
+            OrderedDict()
+        )
+        self._autocomplete_tasks: dict[int, asyncio.Task[list[str]]] = {}
+
     @abstractmethod
     async def parse(self, argument: str, *, bot: Kolkra) -> T:
         """Parse a value from a human-readable string into an object.
@@ -48,6 +98,22 @@ class SimpleConverter(commands.Converter[T], app_commands.Transformer, Generic[T
             str: A string representation to be returned to the user.
         """
 
+    async def generate_suggestions(
+        self, argument: str, value: T, *, bot: Kolkra
+    ) -> list[str]:
+        """Return autocomplete suggestions for a value, best first. Each must parse back into the intended value.
+        Defaults to just the result of `generate_autocomplete`.
+
+        Args:
+            argument (str): The user-provided string the value was parsed from.
+            value (T): The value parsed from user input.
+            bot (Kolkra): The bot instance, if needed to return a dynamic value.
+
+        Returns:
+            list[str]: String representations to offer the user.
+        """
+        return [await self.generate_autocomplete(value, bot=bot)]
+
     async def convert(  # pyright: ignore [reportIncompatibleMethodOverride]
         self, ctx: KolkraContext, argument: str
     ) -> T:
@@ -61,14 +127,56 @@ class SimpleConverter(commands.Converter[T], app_commands.Transformer, Generic[T
     async def autocomplete(  # pyright: ignore [reportIncompatibleMethodOverride]
         self, interaction: Interaction[Kolkra], value: str, /
     ) -> list[app_commands.Choice[str]]:
-        try:
-            res = await self.generate_autocomplete(
-                await self.parse(value, bot=interaction.client),
-                bot=interaction.client,
+        if (suggestions := self.cached_suggestions(value)) is None:
+            user_id = interaction.user.id
+            # A newer keystroke makes any in-flight request from the same user pointless
+            if previous := self._autocomplete_tasks.get(user_id):
+                previous.cancel()
+            task = self._autocomplete_tasks[user_id] = asyncio.create_task(
+                self.suggest(value, bot=interaction.client)
             )
+            try:
+                done, _ = await asyncio.wait({task}, timeout=AUTOCOMPLETE_BUDGET)
+            finally:
+                if not task.done():
+                    task.cancel()
+                if self._autocomplete_tasks.get(user_id) is task:
+                    del self._autocomplete_tasks[user_id]
+            if not done or task.cancelled():  # Over budget or superseded
+                return []
+            suggestions = task.result()
+            self.cache_suggestions(value, suggestions)
+        return [
+            app_commands.Choice(name=res, value=res)
+            for res in suggestions[:MAX_CHOICES]
+        ]
+
+    async def suggest(self, argument: str, *, bot: Kolkra) -> list[str]:
+        try:
+            value = await self.parse(argument, bot=bot)
+            suggestions = await self.generate_suggestions(argument, value, bot=bot)
         except commands.BadArgument:
             return []
-        return [app_commands.Choice(name=res, value=res)]
+        return list(dict.fromkeys(suggestions))  # Dedupe, keeping the ranking
+
+    def cached_suggestions(self, argument: str) -> list[str] | None:
+        if (entry := self._autocomplete_cache.get(argument)) is None:
+            return None
+        expires, suggestions = entry
+        if expires <= time.monotonic():
+            del self._autocomplete_cache[argument]
+            return None
+        self._autocomplete_cache.move_to_end(argument)
+        return suggestions
+
+    def cache_suggestions(self, argument: str, suggestions: list[str]) -> None:
+        self._autocomplete_cache[argument] = (
+            time.monotonic() + self.autocomplete_ttl,
+            suggestions,
+        )
+        self._autocomplete_cache.move_to_end(argument)
+        while len(self._autocomplete_cache) > AUTOCOMPLETE_CACHE_SIZE:
+            self._autocomplete_cache.popitem(last=False)
 
 
 class BadDatetime(commands.BadArgument):
@@ -76,26 +184,140 @@ class BadDatetime(commands.BadArgument):
         super().__init__(f"{argument!r} is not in a known date/time format.")
 
 
+PreferDatesFrom: TypeAlias = Literal["current_period", "past", "future"]
+DATE_PREFERENCES: tuple[PreferDatesFrom, ...] = ("future", "past", "current_period")
+
+# Restricting dateparser to the languages people actually use here saves it from trying to detect among ~200 of them
+DATE_LANGUAGES = ["en"]
+# Relative inputs like "tomorrow" depend on the current time, so cached results are only reused within this window
+DATE_CACHE_BUCKET = 5
+DATE_CACHE_SIZE = 1024
+
+UNIX_TIMESTAMP_REGEX = re.compile(r"<t:(-?\d+)(?::[tTdDfFR])?>|(-?\d{9,11})")
+RELATIVE_REGEX = re.compile(r"in\s+(?P<future>.+)|(?P<past>.+?)\s+ago", re.IGNORECASE)
+
+# Only touched from the event loop, so it needs no lock
+_date_cache: OrderedDict[tuple[str, PreferDatesFrom, int], datetime | None] = (
+    OrderedDict()
+)
+
+
+@cache
+def date_parser(prefer_dates_from: PreferDatesFrom) -> "DateDataParser":
+    """Get the shared date parser for a preference, creating it on first use."""
+    # dateparser is slow to import and converters are created at import time, so wait until one is actually used
+    from dateparser.date import DateDataParser
+
+    return DateDataParser(
+        languages=DATE_LANGUAGES,
+        settings={
+            "RETURN_AS_TIMEZONE_AWARE": True,
+            "PREFER_DATES_FROM": prefer_dates_from,
+        },
+    )
+
+
+def parse_datetime_fast(argument: str) -> datetime | None:
+    """Parse the common formats that don't need dateparser: Unix/Discord timestamps, ISO 8601 and "in 2h"/"2h ago".
+
+    Returns:
+        datetime | None: The parsed datetime, or None if the input isn't in one of these formats.
+    """
+    if match := UNIX_TIMESTAMP_REGEX.fullmatch(argument):
+        try:
+            return datetime.fromtimestamp(
+                int(match.group(1) or match.group(2)), tz=timezone.utc
+            )
+        except (OverflowError, OSError, ValueError):
+            return None
+    if match := RELATIVE_REGEX.fullmatch(argument):
+        if (secs := pytimeparse.parse(match["future"] or match["past"])) is None:
+            return None
+        delta = timedelta(seconds=secs)
+        return utcnow() + delta if match["future"] else utcnow() - delta
+    try:
+        dt = datetime.fromisoformat(argument)
+    except ValueError:
+        return None
+    # Same as dateparser: no explicit timezone means local time
+    return dt if dt.tzinfo else dt.astimezone()
+
+
+def parse_datetime_slow(
+    argument: str, prefer_dates_from: PreferDatesFrom
+) -> datetime | None:
+    """Parse a date/time with dateparser. This blocks for a while, so run it with `run_blocking`."""
+    return date_parser(prefer_dates_from).get_date_data(argument)["date_obj"]
+
+
+async def parse_datetime(
+    argument: str, prefer_dates_from: PreferDatesFrom
+) -> datetime | None:
+    """Parse a date/time in just about any format.
+
+    The fast paths and recent results are checked on the event loop; only inputs that need dateparser are handed
+    off to a worker thread.
+
+    Args:
+        argument (str): The user-provided string.
+        prefer_dates_from (PreferDatesFrom): Whether ambiguous inputs should resolve to the past or future.
+
+    Returns:
+        datetime | None: The parsed, timezone-aware datetime, or None if it couldn't be parsed.
+    """
+    argument = argument.strip()
+    if (dt := parse_datetime_fast(argument)) is not None:
+        return dt
+    key = (argument, prefer_dates_from, int(time.time() // DATE_CACHE_BUCKET))
+    if key not in _date_cache:
+        _date_cache[key] = await run_blocking(
+            parse_datetime_slow, argument, prefer_dates_from
+        )
+    _date_cache.move_to_end(key)
+    while len(_date_cache) > DATE_CACHE_SIZE:
+        _date_cache.popitem(last=False)
+    return _date_cache[key]
+
+
 class DatetimeConverter(SimpleConverter[datetime]):
-    def __init__(
-        self, prefer_dates_from: Literal["current_period", "past", "future"]
-    ) -> None:
+    autocomplete_ttl = DATE_CACHE_BUCKET
+
+    def __init__(self, prefer_dates_from: PreferDatesFrom) -> None:
         super().__init__()
-        self.parser = dateparser.date.DateDataParser(
-            settings={
-                "RETURN_AS_TIMEZONE_AWARE": True,
-                "PREFER_DATES_FROM": prefer_dates_from,
-            }
-        )
+        self.prefer_dates_from: PreferDatesFrom = prefer_dates_from
 
     async def parse(self, argument: str, *, bot: Kolkra) -> datetime:
-        if not (dt := self.parser.get_date_data(argument)["date_obj"]):
+        if not (dt := await parse_datetime(argument, self.prefer_dates_from)):
             raise BadDatetime(argument)
         return dt.replace(microsecond=0)
 
     async def generate_autocomplete(self, value: datetime, *, bot: Kolkra) -> str:
         return value.isoformat()
 
+    async def generate_suggestions(
+        self, argument: str, value: datetime, *, bot: Kolkra
+    ) -> list[str]:
+        suggestions = [value]
+        # Ambiguous inputs (e.g. "friday") may mean something else to the user than what we prefer, so offer that too.
+        # The fast path's formats aren't ambiguous, so there's no need to ask dateparser about those.
+        if parse_datetime_fast(argument.strip()) is None:
+            suggestions += await self.alternatives(argument)
+        return [
+            await self.generate_autocomplete(dt, bot=bot)
+            for dt in sorted(set(suggestions), key=suggestions.index)
+        ]
+
+    async def alternatives(self, argument: str) -> list[datetime]:
+        """What the input would mean under the other date preferences."""
+        results = await asyncio.gather(
+            *(
+                parse_datetime(argument, prefer_dates_from)
+                for prefer_dates_from in DATE_PREFERENCES
+                if prefer_dates_from != self.prefer_dates_from
+            )
+        )
+        return [dt.replace(microsecond=0) for dt in results if dt]
+
 
 class BadTimeDelta(commands.BadArgument):
     def __init__(self, argument: str):
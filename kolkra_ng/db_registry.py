@@ -0,0 +1,20 @@
+"""A registry of the document models cogs use, so they can all be initialized with a single `init_beanie` call."""
+
+from typing import TypeVar
+
+from beanie import Document
+
+DocumentT = TypeVar("DocumentT", bound=type[Document])
+
+_models: dict[str, type[Document]] = {}
+
+
+def register_model(model: DocumentT) -> DocumentT:
+    """Class decorator declaring a document model to be initialized by `Kolkra.init_db_models`."""
+    # Keyed by import path, so a reloaded extension's models replace the stale ones
+    _models[f"{model.__module__}.{model.__qualname__}"] = model
+    return model
+
+
+def registered_models() -> list[type[Document]]:
+    return list(_models.values())
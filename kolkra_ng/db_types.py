@@ -59,9 +59,7 @@ class RoleRepr(BaseModel):
         return cls(guild_id=role.guild.id, role_id=role.id)
 
     async def get(self, bot: Kolkra) -> Role | None:
-        return (
-            bot.get_guild(self.guild_id) or await bot.fetch_guild(self.guild_id)
-        ).get_role(self.role_id)
+        return await bot.role_resolver.resolve(self.guild_id, self.role_id)
 
     def __hash__(self) -> int:
         return hash((self.guild_id, self.role_id))
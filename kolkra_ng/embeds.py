@@ -1,10 +1,10 @@
 import contextlib
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from discord import Color, Embed
 from discord.ext import commands
-from pydantic import BaseModel, ConfigDict, Field
+from discord.utils import MISSING
 from typing_extensions import Self
 
 
@@ -22,83 +22,131 @@ def icons8(name: str, style: str = "color", animated: bool = False) -> str:
     return f"https://img.icons8.com/{style}/{name}.{'gif' if animated else 'png'}"
 
 
-class OkEmbed(Embed):
-    def __init__(
-        self,
-        title: str = "Success",
-        color: Color | None = None,
-        **kwargs: Any,
-    ):
-        color = color or Color.green()
-        super().__init__(title=title, color=color, **kwargs)
-        self.set_thumbnail(url=icons8("ok"))
+def _str_or_none(value: Any) -> str | None:
+    return None if value is None else str(value)
 
 
-class WarningEmbed(Embed):
-    def __init__(
-        self,
-        title: str = "Warning",
-        color: Color | None = None,
-        **kwargs: Any,
-    ):
-        color = color or Color.orange()
-        super().__init__(title=title, color=color, **kwargs)
-        self.set_thumbnail(url=icons8("error"))
+class EmbedTemplate:
+    """The unchanging parts of an embed that gets sent over and over again.
+
+    The color and thumbnail URL are worked out once up front, so stamping out a new embed
+    is just a constructor call and a fresh thumbnail dict.
+    """
 
+    __slots__ = ("title", "color", "description", "thumbnail_url")
 
-class ErrorEmbed(Embed):
     def __init__(
         self,
-        title: str = "Error",
+        title: str | None = None,
         color: Color | None = None,
-        **kwargs: Any,
-    ):
-        color = color or Color.red()
-        super().__init__(title=title, color=color, **kwargs)
-        self.set_thumbnail(url=icons8("broken-robot"))
+        description: str | None = None,
+        thumbnail_url: str | None = None,
+    ) -> None:
+        self.title = title
+        self.color = color
+        self.description = description
+        self.thumbnail_url = thumbnail_url
+
+    def build(self, **kwargs: Any) -> Embed:
+        """Creates a new embed from the template.
+
+        Args:
+            **kwargs (Any): Same as `apply`.
+
+        Returns:
+            Embed: The new embed, safe to modify.
+        """
+        return self.apply(TemplateEmbed.__new__(TemplateEmbed), **kwargs)
+
+    def apply(
+        self,
+        embed: Embed,
+        title: Any = MISSING,
+        color: Color | int | None = None,
+        description: Any = MISSING,
+        *,
+        colour: Color | int | None = None,
+        url: Any = None,
+        timestamp: datetime | None = None,
+    ) -> Embed:
+        """Fills in a blank embed from the template, the way `Embed.__init__` would.
+
+        Args:
+            embed (Embed): The embed to fill in. Anything already set on it is overwritten.
+            title (Any, optional): Overrides the template's title. Defaults to the template's.
+            color (Color | int | None, optional): Overrides the template's color. Defaults to the template's.
+            description (Any, optional): Overrides the template's description. Defaults to the template's.
+            colour (Color | int | None, optional): Alias for `color`.
+            url (Any, optional): The URL the title links to. Defaults to None.
+            timestamp (datetime | None, optional): The embed's timestamp. Defaults to None.
+
+        Returns:
+            Embed: The same embed, for chaining.
+        """
+        # Setting slots directly skips the Embed constructor's type checks and conversions,
+        # which the template's own values have already been through.
+        embed.type = "rich"
+        embed._flags = 0
+        embed.title = self.title if title is MISSING else _str_or_none(title)
+        embed.description = (
+            self.description if description is MISSING else _str_or_none(description)
+        )
+        embed.url = _str_or_none(url)
+        if color := color or colour:
+            embed.colour = color
+        elif self.color is not None:
+            embed._colour = self.color
+        if self.thumbnail_url:
+            embed._thumbnail = {"url": self.thumbnail_url}
+        if timestamp is not None:
+            embed.timestamp = timestamp
+        return embed
 
 
-class QuestionEmbed(Embed):
-    def __init__(
-        self,
-        title: str = "Question",
-        color: Color | None = None,
-        **kwargs: Any,
-    ):
-        color = color or Color.blurple()
-        super().__init__(title=title, color=color, **kwargs)
-        self.set_thumbnail(url=icons8("ask-question"))
+class TemplateEmbed(Embed):
+    """An embed whose defaults come from a class-level `EmbedTemplate`."""
 
+    template: ClassVar[EmbedTemplate] = EmbedTemplate()
 
-class InfoEmbed(Embed):
     def __init__(
         self,
-        title: str = "Info",
-        color: Color | None = None,
+        title: Any = MISSING,
+        color: Color | int | None = None,
         **kwargs: Any,
     ):
-        color = color or Color.blue()
-        super().__init__(title=title, color=color, **kwargs)
-        self.set_thumbnail(url=icons8("info"))
+        self.template.apply(self, title=title, color=color, **kwargs)
 
 
-class AccessDeniedEmbed(Embed):
-    def __init__(
-        self,
-        title: str = "Access Denied",
-        color: Color | None = None,
-        **kwargs: Any,
-    ):
-        color = color or Color.red()
-        super().__init__(title=title, color=color, **kwargs)
-        self.set_thumbnail(url=icons8("no-entry"))
+class OkEmbed(TemplateEmbed):
+    template = EmbedTemplate("Success", Color.green(), thumbnail_url=icons8("ok"))
+
+
+class WarningEmbed(TemplateEmbed):
+    template = EmbedTemplate("Warning", Color.orange(), thumbnail_url=icons8("error"))
+
+
+class ErrorEmbed(TemplateEmbed):
+    template = EmbedTemplate("Error", Color.red(), thumbnail_url=icons8("broken-robot"))
+
+
+class QuestionEmbed(TemplateEmbed):
+    template = EmbedTemplate(
+        "Question", Color.blurple(), thumbnail_url=icons8("ask-question")
+    )
+
+
+class InfoEmbed(TemplateEmbed):
+    template = EmbedTemplate("Info", Color.blue(), thumbnail_url=icons8("info"))
+
 
+class AccessDeniedEmbed(TemplateEmbed):
+    template = EmbedTemplate(
+        "Access Denied", Color.red(), thumbnail_url=icons8("no-entry")
+    )
 
-class WaitEmbed(Embed):
-    def __init__(self, title: str = "Wait", color: Color | None = None, **kwargs: Any):
-        color = color or Color.yellow()
-        super().__init__(title=title, color=color, **kwargs)
-        self.set_thumbnail(url=icons8("hourglass"))
+
+class WaitEmbed(TemplateEmbed):
+    template = EmbedTemplate("Wait", Color.yellow(), thumbnail_url=icons8("hourglass"))
 
 
 MAX_LENGTHS = {
@@ -113,46 +161,97 @@ MAX_LENGTHS = {
 }
 
 
-class _EmbedFooter(BaseModel):
-    text: str | None = Field(max_length=MAX_LENGTHS["footer.text"], default=None)
-    icon_url: str | None = None
-
+class EmbedTooLong(ValueError):
+    def __init__(self, attribute: str, length: int) -> None:
+        super().__init__(
+            f"Embed {attribute} is {length} characters long, but can be at most {MAX_LENGTHS[attribute]}."
+        )
 
-class _EmbedField(BaseModel):
-    name: str | None = Field(max_length=MAX_LENGTHS["field.name"], default=None)
-    value: str | None = Field(max_length=MAX_LENGTHS["field.value"], default=None)
-    inline: bool = True
 
+def _check_length(attribute: str, value: Any) -> None:
+    if value is not None and len(value := str(value)) > MAX_LENGTHS[attribute]:
+        raise EmbedTooLong(attribute, len(value))
 
-class _EmbedMedia(BaseModel):
-    url: str | None = None
 
+def _field(name: Any, value: Any, inline: bool = True) -> dict[str, Any]:
+    return {"name": name, "value": value, "inline": inline}
 
-class _EmbedAuthor(BaseModel):
-    name: str | None = Field(max_length=MAX_LENGTHS["author.name"], default=None)
-    url: str | None = None
-    icon_url: str | None = None
 
+class SplitEmbed:
+    """Representation of an embed that can have its description and fields split across multiple embeds.
 
-class SplitEmbed(BaseModel):
-    """Representation of an embed that can have its description and fields split across multiple embeds."""
+    Length limits are only checked when the embeds are built, so adding fields stays cheap.
+    """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    __slots__ = (
+        "color",
+        "title",
+        "url",
+        "description",
+        "timestamp",
+        "footer",
+        "image",
+        "thumbnail",
+        "author",
+        "fields",
+    )
 
-    color: int | Color | None = None
-    title: str | None = Field(default=None, max_length=MAX_LENGTHS["title"])
-    url: str | None = None
-    description: str | None = None
-    timestamp: datetime | None = None
-    footer: _EmbedFooter | None = None
-    image: _EmbedMedia | None = None
-    thumbnail: _EmbedMedia | None = None
-    author: _EmbedAuthor | None = None
-    fields: list[_EmbedField] | None = None
+    def __init__(
+        self,
+        *,
+        color: int | Color | None = None,
+        title: str | None = None,
+        url: str | None = None,
+        description: str | None = None,
+        timestamp: datetime | None = None,
+        footer: dict[str, Any] | None = None,
+        image: dict[str, Any] | None = None,
+        thumbnail: dict[str, Any] | None = None,
+        author: dict[str, Any] | None = None,
+        fields: list[dict[str, Any]] | None = None,
+    ) -> None:
+        self.color = color
+        self.title = title
+        self.url = url
+        self.description = description
+        self.timestamp = timestamp
+        self.footer = footer
+        self.image = image
+        self.thumbnail = thumbnail
+        self.author = author
+        self.fields = fields
 
     @classmethod
     def from_single(cls, embed: Embed) -> Self:
-        return cls(**embed.to_dict())  # pyright: ignore [reportCallIssue]
+        data = embed.to_dict()
+        media = lambda key: {"url": data[key]["url"]} if key in data else None
+        return cls(
+            color=embed.color,
+            title=embed.title,
+            url=embed.url,
+            description=embed.description,
+            timestamp=embed.timestamp,
+            footer=dict(data["footer"]) if "footer" in data else None,
+            image=media("image"),
+            thumbnail=media("thumbnail"),
+            author=dict(data["author"]) if "author" in data else None,
+            fields=[dict(f) for f in data["fields"]] if "fields" in data else None,
+        )
+
+    def validate(self) -> None:
+        """Check everything that can't be split against Discord's length limits.
+
+        Raises:
+            EmbedTooLong: Something is too long.
+        """
+        _check_length("title", self.title)
+        if self.footer:
+            _check_length("footer.text", self.footer.get("text"))
+        if self.author:
+            _check_length("author.name", self.author.get("name"))
+        for field in self.fields or ():
+            _check_length("field.name", field["name"])
+            _check_length("field.value", field["value"])
 
     def __split_description(self) -> list[str] | None:
         if not self.description:
@@ -166,84 +265,89 @@ class SplitEmbed(BaseModel):
 
     def __populate_top_embed(self, embed: Embed) -> None:
         if self.thumbnail:
-            embed.set_thumbnail(**dict(self.thumbnail))
+            embed.set_thumbnail(**self.thumbnail)
         if self.author:
-            embed.set_author(**dict(self.author))
+            embed.set_author(**self.author)
         embed.title = self.title
         embed.url = self.url
 
     def __populate_bottom_embed(self, embed: Embed) -> None:
         embed.timestamp = self.timestamp
         if self.footer:
-            embed.set_footer(**dict(self.footer))
+            embed.set_footer(**self.footer)
         if self.image:
-            embed.set_image(**dict(self.image))
+            embed.set_image(**self.image)
 
     def embeds(self) -> list[Embed]:
-        base = lambda: Embed(color=self.color)
-        result = []
-        e = base()
-
-        if chunks := self.__split_description():
-            for chunk in chunks:
-                e = base()
-                e.description = chunk
-                result.append(e)
-
-        if self.fields:
-            for field in self.fields:
-                if (
-                    len(e.fields) > MAX_LENGTHS["fields"]
-                    or len(e) + len((field.name or "") + (field.value or ""))
-                    > MAX_LENGTHS["total"]
-                ):
-                    result.append(e)
-                    e = base()
-                e.add_field(**dict(field))
-
-        if not result:
-            result.append(e)
+        self.validate()
+        result: list[Embed] = []
+
+        def new_embed() -> Embed:
+            result.append(e := Embed(color=self.color))
+            return e
+
+        for chunk in self.__split_description() or ():
+            new_embed().description = chunk
+        e = result[-1] if result else new_embed()
+
+        # The footer goes on the last embed, which we don't know yet, so leave room for it on every one
+        limit = MAX_LENGTHS["total"] - len(str((self.footer or {}).get("text") or ""))
+        size = len(e.description or "")
+        if len(result) == 1:
+            size += len(self.title or "") + len(
+                str((self.author or {}).get("name") or "")
+            )
+        count = 0
+        for field in self.fields or ():
+            field_size = len(str(field["name"] or "")) + len(str(field["value"] or ""))
+            if count >= MAX_LENGTHS["fields"] or size + field_size > limit:
+                e = new_embed()
+                size = count = 0
+            e.add_field(**field)
+            size += field_size
+            count += 1
+
         self.__populate_top_embed(result[0])
         self.__populate_bottom_embed(result[-1])
         return result
 
     # Clone of d.py's Embed API
-    def set_footer(self, **kwargs) -> Self:
-        self.footer = _EmbedFooter(**kwargs)
+    def set_footer(self, *, text: Any = None, icon_url: Any = None) -> Self:
+        self.footer = {"text": text, "icon_url": icon_url}
         return self
 
     def remove_footer(self) -> Self:
         self.footer = None
         return self
 
-    def set_image(self, **kwargs) -> Self:
-        self.image = _EmbedMedia(**kwargs)
+    def set_image(self, *, url: Any) -> Self:
+        self.image = {"url": url}
         return self
 
-    def set_thumbnail(self, **kwargs) -> Self:
-        self.thumbnail = _EmbedMedia(**kwargs)
+    def set_thumbnail(self, *, url: Any) -> Self:
+        self.thumbnail = {"url": url}
         return self
 
-    def set_author(self, **kwargs) -> Self:
-        self.author = _EmbedAuthor(**kwargs)
+    def set_author(self, *, name: Any, url: Any = None, icon_url: Any = None) -> Self:
+        self.author = {"name": name, "url": url, "icon_url": icon_url}
         return self
 
     def remove_author(self) -> Self:
         self.author = None
         return self
 
-    def add_field(self, **kwargs) -> Self:
-        f = _EmbedField(**kwargs)
+    def add_field(self, *, name: Any, value: Any, inline: bool = True) -> Self:
         if self.fields is None:
             self.fields = []
-        self.fields.append(f)
+        self.fields.append(_field(name, value, inline))
         return self
 
-    def insert_field_at(self, index: int, **kwargs) -> Self:
-        f = _EmbedField(**kwargs)
+    def insert_field_at(
+        self, index: int, *, name: Any, value: Any, inline: bool = True
+    ) -> Self:
         if self.fields is None:
             self.fields = []
-        self.fields.insert(index, f)
+        self.fields.insert(index, _field(name, value, inline))
         return self
 
     def clear_fields(self) -> Self:
@@ -257,9 +361,13 @@ class SplitEmbed(BaseModel):
             self.fields.pop(index)
         return self
 
-    def set_field_at(self, index: int, **kwargs) -> Self:
+    def set_field_at(
+        self, index: int, *, name: Any, value: Any, inline: bool = True
+    ) -> Self:
         try:
-            self.fields[index] = _EmbedField(**kwargs)  # pyright: ignore # noqa: PGH003
-        except (TypeError, IndexError, AttributeError) as e:
+            self.fields[index] = _field(  # pyright: ignore # noqa: PGH003
+                name, value, inline
+            )
+        except (TypeError, IndexError) as e:
             raise IndexError(index) from e
         return self
@@ -1,8 +1,6 @@
 import textwrap
-from collections.abc import Mapping
-from copy import deepcopy
-from difflib import get_close_matches
-from typing import Any
+from collections.abc import Callable, Iterable, Mapping
+from typing import TYPE_CHECKING, Any
 
 from discord import Embed, utils
 from discord.ext import commands
@@ -12,19 +10,101 @@ from kolkra_ng.embeds import InfoEmbed, SplitEmbed
 from kolkra_ng.views.confirm import Confirm
 from kolkra_ng.views.pager import Pager, group_embeds
 
+if TYPE_CHECKING:
+    from kolkra_ng.bot import Kolkra
+
+
+class HelpRenderCache:
+    """The parts of help output that only change when commands do.
+
+    Lives on the bot (help commands are copied per invocation) and is cleared whenever a command is added or removed,
+    which covers extension (re)loads, including through jishaku.
+    """
+
+    def __init__(self) -> None:
+        self.displays: dict[tuple[commands.Command, bool], str] = {}
+        self.flags: dict[commands.Command, list[str] | None] = {}
+        self.signatures: dict[tuple[commands.Command, str], str] = {}
+
+    def clear(self) -> None:
+        self.displays.clear()
+        self.flags.clear()
+        self.signatures.clear()
+
 
 class KolkraHelp(commands.HelpCommand):
     """Shows this message."""
 
     context: KolkraContext  # pyright: ignore [reportIncompatibleVariableOverride]
+    _can_run_cache: dict[commands.Command, tuple[bool, commands.CommandError | None]]
+
+    async def prepare_help_command(  # pyright: ignore [reportIncompatibleMethodOverride]
+        self, ctx: KolkraContext, command: str | None = None, /
+    ) -> None:
+        # A fresh copy of the help command is made for each invocation, so this is per-context
+        self._can_run_cache = {}
+        await super().prepare_help_command(ctx, command)
+
+    async def can_run(
+        self, command: commands.Command
+    ) -> tuple[bool, commands.CommandError | None]:
+        """Checks whether the invoking user can run a command, remembering the result for this invocation.
+
+        Returns:
+            tuple[bool, commands.CommandError | None]: Whether the command can be run, and the error raised if not.
+        """
+        if (cached := self._can_run_cache.get(command)) is not None:
+            return cached
+        try:
+            result = (await command.can_run(self.context), None)
+        except commands.CommandError as e:
+            result = (False, e)
+        self._can_run_cache[command] = result
+        return result
+
+    async def filter_commands(
+        self,
+        cmds: Iterable[commands.Command[Any, ..., Any]],
+        /,
+        *,
+        sort: bool = False,
+        key: Callable[[commands.Command[Any, ..., Any]], Any] | None = None,
+    ) -> list[commands.Command[Any, ..., Any]]:
+        sort_key: Callable[[commands.Command[Any, ..., Any]], Any] = key or (
+            lambda c: c.name
+        )
+        iterator = cmds if self.show_hidden else filter(lambda c: not c.hidden, cmds)
+        if self.verify_checks is False or (
+            self.verify_checks is None and not self.context.guild
+        ):
+            return sorted(iterator, key=sort_key) if sort else list(iterator)
+        ret = [cmd for cmd in iterator if (await self.can_run(cmd))[0]]
+        if sort:
+            ret.sort(key=sort_key)
+        return ret
 
     def base_embed(self, **kwargs) -> Embed:
         return InfoEmbed(**kwargs).set_footer(
             text=f"Type {self.context.clean_prefix}{self.invoked_with} [command|category] for more information."
         )
 
+    @property
+    def render_cache(self) -> HelpRenderCache:
+        bot: "Kolkra" = self.context.bot
+        return bot.help_render_cache
+
     def command_display(
         self, command: commands.Command, include_description: bool = True
+    ) -> str:
+        key = (command, include_description)
+        if (display := self.render_cache.displays.get(key)) is None:
+            display = self.render_cache.displays[key] = self._command_display(
+                command, include_description
+            )
+        return display
+
+    def _command_display(
+        self, command: commands.Command, include_description: bool
     ) -> str:
         name = "|".join([command.name, *command.aliases])
         description = (
@@ -33,7 +113,21 @@ class KolkraHelp(commands.HelpCommand):
         )
         return f"{name}{': ' + description if include_description else ''}"
 
+    def get_command_signature(self, command: commands.Command[Any, ..., Any], /) -> str:
+        # The signature includes the prefix, which differs between e.g. mentions and the regular prefix
+        key = (command, self.context.clean_prefix)
+        if (signature := self.render_cache.signatures.get(key)) is None:
+            signature = self.render_cache.signatures[key] = (
+                super().get_command_signature(command)
+            )
+        return signature
+
     def command_flags(self, command: commands.Command) -> list[str] | None:
+        if command not in self.render_cache.flags:
+            self.render_cache.flags[command] = self._command_flags(command)
+        return self.render_cache.flags[command]
+
+    def _command_flags(self, command: commands.Command) -> list[str] | None:
         flags: dict[str, commands.Flag] = {}
         for param in command.params.values():
             if isinstance(param.annotation, commands.flags.FlagsMeta):
@@ -60,14 +154,11 @@ class KolkraHelp(commands.HelpCommand):
             name="Usage",
             value=self.get_command_signature(command),
         )
-        try:
-            can_run, err = (
-                await command.can_run(self.context),
-                "no error raised",
-            )
-        except commands.CommandError as e:
-            can_run, err = False, e
-        embed.add_field(name="Can use", value="Yes" if can_run else f"No: {err}")
+        can_run, err = await self.can_run(command)
+        embed.add_field(
+            name="Can use",
+            value="Yes" if can_run else f"No: {err or 'no error raised'}",
+        )
         if flags := self.command_flags(command):
             embed.add_field(name="Flags", value="\n".join(flags))
 
@@ -84,9 +175,19 @@ class KolkraHelp(commands.HelpCommand):
         for cmd in await self.filter_commands(group.commands):
             subcommand_pages.add_line(f"- {self.command_display(cmd)}")
 
-        base = await self.command_embed(group)
+        base = (await self.command_embed(group)).to_dict()
+        fields = base.get("fields", [])
+        # Only the field list differs between pages, so there's no need to deep-copy the whole embed for each
         embeds = [
-            deepcopy(base).add_field(name="Subcommands", value=page)
+            Embed.from_dict(
+                {
+                    **base,
+                    "fields": [
+                        *fields,
+                        {"name": "Subcommands", "value": page, "inline": True},
+                    ],
+                }
+            )
             for page in subcommand_pages.pages
         ]
         await Pager([[embed] for embed in embeds], self.context.author).respond(
@@ -141,24 +242,19 @@ class KolkraHelp(commands.HelpCommand):
     async def command_not_found(  # pyright: ignore [reportIncompatibleMethodOverride]
         self, string: str, /
     ) -> str | None:
-        all_commands = []
-        for cmd in self.context.bot.commands:
-            try:
-                can_run: bool = await cmd.can_run(self.context)
-            except commands.CommandError:
-                can_run = False
-            if can_run:
-                all_commands.append(cmd.name)
-                all_commands.extend(cmd.aliases)
-        if (
-            typo := get_close_matches(string, all_commands)
-        ) and await Confirm().respond(
+        bot: "Kolkra" = self.context.bot
+        typo: str | None = None
+        for name, cmd in bot.command_index.suggest(string):
+            if (await self.can_run(cmd))[0]:
+                typo = name
+                break
+        if typo and await Confirm().respond(
             self.context,
             embed=self.base_embed(
-                description=f"{string!r} is not a known command or category. Did you mean: {typo[0]!r}?",
+                description=f"{string!r} is not a known command or category. Did you mean: {typo!r}?",
             ),
         ):
-            await self.context.send_help(typo[0])
+            await self.context.send_help(typo)
             return
         return (
             f"{string!r} is not a known command or category. "
@@ -0,0 +1,83 @@
+"""A lightweight, in-process take on `python -X importtime`, so slow imports show up in the bot's own logs.
+
+Heavy dependencies that only a single command uses (psutil, numpy, wonderwords) are imported inside that command
+instead of at module level, so they don't count towards startup time. Keep it that way when adding to those commands.
+"""
+
+import builtins
+import sys
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from types import ModuleType
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    importer: str | None
+    cumulative: float
+    self_time: float
+
+    @property
+    def package(self) -> str:
+        return self.module.partition(".")[0]
+
+
+@dataclass
+class ImportProfiler:
+    """Times first-time imports by wrapping `builtins.__import__`.
+
+    Like `-X importtime`, each module's self time excludes the time spent importing its own dependencies.
+    """
+
+    timings: dict[str, ImportTiming] = field(default_factory=dict)
+    _stack: list[tuple[str, float]] = field(default_factory=list)
+    _original_import = staticmethod(builtins.__import__)
+
+    def install(self) -> None:
+        builtins.__import__ = self._import
+
+    def uninstall(self) -> None:
+        builtins.__import__ = self._original_import
+
+    def _import(
+        self,
+        name: str,
+        globals: Mapping[str, object] | None = None,  # noqa: A002
+        locals: Mapping[str, object] | None = None,  # noqa: A002
+        fromlist: Sequence[str] = (),
+        level: int = 0,
+    ) -> ModuleType:
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        importer = self._stack[-1][0] if self._stack else None
+        self._stack.append((name, 0))
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            _, children = self._stack.pop()
+            if self._stack:
+                parent, parent_children = self._stack[-1]
+                self._stack[-1] = (parent, parent_children + elapsed)
+            self.timings.setdefault(
+                name, ImportTiming(name, importer, elapsed, elapsed - children)
+            )
+
+    def slowest_packages(self, limit: int = 15) -> list[ImportTiming]:
+        """The slowest points where one package pulled in another (or something was imported directly)."""
+        entries = [
+            t
+            for t in self.timings.values()
+            if t.importer is None or t.importer.partition(".")[0] != t.package
+        ]
+        return sorted(entries, key=lambda t: t.cumulative, reverse=True)[:limit]
+
+    def report(self, limit: int = 15) -> str:
+        return "\n".join(
+            f"{t.cumulative * 1000:8.1f}ms  {t.module}"
+            + (f" (imported by {t.importer})" if t.importer else "")
+            for t in self.slowest_packages(limit)
+        )
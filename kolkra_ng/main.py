@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import logging
 from pathlib import Path
@@ -5,8 +6,8 @@ from pathlib import Path
 import discord
 from rich.logging import RichHandler
 
-from kolkra_ng.bot import Kolkra
 from kolkra_ng.config import Config
+from kolkra_ng.import_profiler import ImportProfiler
 
 logging.basicConfig(
     format="%(message)s",
@@ -24,12 +25,31 @@ logging.captureWarnings(True)
 
 log = logging.getLogger(__name__)
 
+parser = argparse.ArgumentParser(description="Run Kolkra-NG.")
+parser.add_argument(
+    "--force-sync",
+    action="store_true",
+    help="sync application (slash) commands even if they haven't changed since the last sync",
+)
+parser.add_argument(
+    "--profile-imports",
+    action="store_true",
+    help="log the slowest imports once initial setup is complete",
+)
+
+
+async def main(args: argparse.Namespace) -> None:
+    profiler = None
+    if args.profile_imports:
+        profiler = ImportProfiler()
+        profiler.install()
+    # Imported here so the profiler sees the bot and everything it pulls in
+    from kolkra_ng.bot import Kolkra
 
-async def main() -> None:
     log.info("Parsing configuration")
     config = Config.from_files(Path("config.toml"))
     log.info("Initializing client")
-    bot = Kolkra(config)
+    bot = Kolkra(config, force_sync=args.force_sync, import_profiler=profiler)
 
     log.info("Starting up")
     try:
@@ -40,4 +60,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+
+from discord import Client, NotFound, Role
+
+log = logging.getLogger(__name__)
+
+
+class RoleResolver:
+    """Looks up roles by guild and role ID without going to the API when it can be helped.
+
+    Guilds in the gateway cache are asked first. When a role isn't found there (or the guild isn't cached),
+    the guild's full role list is fetched once and kept until a role event for that guild comes in.
+    Concurrent misses for the same guild share a single request.
+    """
+
+    _fetched: dict[int, dict[int, Role]]
+    _pending: dict[int, asyncio.Task[dict[int, Role]]]
+
+    def __init__(self, client: Client) -> None:
+        self.client = client
+        self._fetched = {}
+        self._pending = {}
+
+    def get(self, guild_id: int, role_id: int) -> Role | None:
+        """Looks up a role without making any API calls.
+
+        Args:
+            guild_id (int): The guild the role belongs to.
+            role_id (int): The role's ID.
+
+        Returns:
+            Role | None: The role, if it's cached anywhere.
+        """
+        if (guild := self.client.get_guild(guild_id)) and (
+            role := guild.get_role(role_id)
+        ):
+            return role
+        return self._fetched.get(guild_id, {}).get(role_id)
+
+    async def resolve(self, guild_id: int, role_id: int) -> Role | None:
+        """Looks up a role, fetching the guild's roles if they aren't cached.
+
+        Args:
+            guild_id (int): The guild the role belongs to.
+            role_id (int): The role's ID.
+
+        Raises:
+            HTTPException: Fetching the roles failed. This does *not* mean the role is gone.
+
+        Returns:
+            Role | None: The role, or None if it (or the guild) no longer exists.
+        """
+        if role := self.get(guild_id, role_id):
+            return role
+        if (roles := self._fetched.get(guild_id)) is None:
+            if not (task := self._pending.get(guild_id)):
+                task = self._pending[guild_id] = asyncio.create_task(
+                    self._fetch_roles(guild_id)
+                )
+            roles = await asyncio.shield(task)
+        return roles.get(role_id)
+
+    async def _fetch_roles(self, guild_id: int) -> dict[int, Role]:
+        log.debug("Fetching roles for guild %s", guild_id)
+        task = asyncio.current_task()
+        try:
+            if guild := self.client.get_guild(guild_id):
+                roles = {role.id: role for role in await guild.fetch_roles()}
+            else:
+                # A fetched guild comes with its roles, so there's no need for a second request
+                roles = {
+                    role.id: role
+                    for role in (await self.client.fetch_guild(guild_id)).roles
+                }
+        except NotFound:
+            roles = {}
+        finally:
+            current = self._pending.get(guild_id) is task
+            if current:
+                del self._pending[guild_id]
+        # If the guild was invalidated mid-fetch, the result may already be stale--hand it to whoever's waiting,
+        # but don't keep it.
+        if current:
+            self._fetched[guild_id] = roles
+        return roles
+
+    def invalidate(self, guild_id: int) -> None:
+        """Forgets the fetched roles for a guild, e.g. after a role is created, edited or deleted, or the bot leaves."""
+        self._fetched.pop(guild_id, None)
+        self._pending.pop(guild_id, None)
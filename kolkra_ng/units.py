@@ -0,0 +1,206 @@
+"""Unit conversion helpers built on pint."""
+
+import logging
+import math
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from functools import lru_cache
+
+import pint
+from pint.facets.plain import PlainQuantity, PlainUnit
+
+log = logging.getLogger(__name__)
+
+# Units people actually convert to, rather than every unit pint knows (which runs into the hundreds for e.g. length)
+COMMON_UNITS = [
+    # Length
+    "millimeter",
+    "centimeter",
+    "meter",
+    "kilometer",
+    "inch",
+    "foot",
+    "yard",
+    "mile",
+    "nautical_mile",
+    # Mass
+    "milligram",
+    "gram",
+    "kilogram",
+    "metric_ton",
+    "ounce",
+    "pound",
+    "stone",
+    # Time
+    "millisecond",
+    "second",
+    "minute",
+    "hour",
+    "day",
+    "week",
+    "year",
+    # Temperature
+    "degree_Celsius",
+    "degree_Fahrenheit",
+    "kelvin",
+    # Area
+    "centimeter ** 2",
+    "meter ** 2",
+    "kilometer ** 2",
+    "hectare",
+    "square_inch",
+    "square_foot",
+    "acre",
+    "square_mile",
+    # Volume
+    "milliliter",
+    "liter",
+    "meter ** 3",
+    "teaspoon",
+    "tablespoon",
+    "fluid_ounce",
+    "cup",
+    "pint",
+    "quart",
+    "gallon",
+    # Speed
+    "meter / second",
+    "kilometer / hour",
+    "foot / second",
+    "mile / hour",
+    "knot",
+    # Energy
+    "joule",
+    "kilojoule",
+    "calorie",
+    "kilocalorie",
+    "watt_hour",
+    "kilowatt_hour",
+    "electron_volt",
+    "british_thermal_unit",
+    # Power
+    "watt",
+    "kilowatt",
+    "horsepower",
+    # Pressure
+    "pascal",
+    "kilopascal",
+    "bar",
+    "atmosphere",
+    "psi",
+    "millimeter_Hg",
+    # Force
+    "newton",
+    "pound_force",
+    # Frequency
+    "hertz",
+    "kilohertz",
+    "megahertz",
+    "gigahertz",
+    # Information (pint treats these as dimensionless, as it does angles, so those can't be listed as well)
+    "bit",
+    "byte",
+    "kilobyte",
+    "megabyte",
+    "gigabyte",
+    "terabyte",
+]
+PARSE_CACHE_SIZE = 512
+
+_lock = threading.Lock()  # Autocomplete may get here from a worker thread
+_conversions: "ConversionTable | None" = None
+
+
+class ConversionTable:
+    """A registry's common units grouped by dimensionality, built once up front, plus a cache of parsed quantities."""
+
+    def __init__(
+        self, ureg: pint.UnitRegistry, units: Iterable[str] = COMMON_UNITS
+    ) -> None:
+        self.ureg = ureg
+        self.targets: defaultdict[pint.util.UnitsContainer, list[pint.Unit]] = (
+            defaultdict(list)
+        )
+        for name in units:
+            try:
+                unit = ureg.parse_units(name)
+            except pint.UndefinedUnitError:
+                log.warning("Skipping unknown unit %r in conversion table", name)
+                continue
+            self.targets[unit.dimensionality].append(unit)
+        self._parse = lru_cache(maxsize=PARSE_CACHE_SIZE)(ureg.Quantity)
+
+    def parse(self, text: str) -> PlainQuantity:
+        """Parse a quantity, reusing the result for inputs seen recently. Don't modify the returned quantity in place."""
+        return self._parse(text.strip())
+
+    def convert(
+        self, quantity: PlainQuantity, budget: float
+    ) -> tuple[list[PlainQuantity], bool]:
+        """Convert a quantity into the common units of its dimensionality (or just its base units if there are none).
+
+        Args:
+            quantity (PlainQuantity): The quantity to convert.
+            budget (float): Roughly how long to spend converting, in seconds.
+
+        Returns:
+            tuple[list[PlainQuantity], bool]: The conversions, and whether they were all done within the budget.
+        """
+        deadline = time.perf_counter() + budget
+        targets = self.targets.get(quantity.dimensionality, [])
+        if quantity.units not in targets and (quantity.dimensionless or not targets):
+            # Dimensionless units aren't necessarily related to each other (e.g. bytes and degrees)
+            targets = [quantity.to_base_units().units]
+        results = []
+        for unit in targets:
+            if time.perf_counter() > deadline:
+                return results, False
+            if not self.same_unit(quantity.units, unit):
+                results.append(quantity.to(unit))
+        return results, True
+
+    def same_unit(self, a: PlainUnit, b: PlainUnit) -> bool:
+        """Whether two units are the same one under different names, e.g. mph and mi/h.
+
+        Comparing the units themselves only works when they're spelled the same way. Comparing zero as well as one
+        keeps offset units like °C and K apart.
+        """
+        if a == b:
+            return True
+        if a.dimensionality != b.dimensionality:
+            return False
+        return math.isclose(
+            self.ureg.Quantity(1, a).to(b).magnitude, 1
+        ) and math.isclose(self.ureg.Quantity(0, a).to(b).magnitude, 0, abs_tol=1e-9)
+
+
+def conversion_table(cache_folder: str | None = ":auto:") -> ConversionTable:
+    """Get the process-wide unit registry's conversion table, building both on first use.
+
+    The registry outlives the tools extension, so reloading it doesn't mean parsing pint's definitions all over again.
+
+    Args:
+        cache_folder (str | None, optional): Where pint should cache its parsed definitions between runs. ":auto:" uses
+            the user cache directory, None disables the cache. Only used when building. Defaults to ":auto:".
+
+    Returns:
+        ConversionTable: The shared conversion table, with the registry available as its `ureg`.
+    """
+    global _conversions
+    with _lock:
+        if _conversions is None:
+            start = time.perf_counter()
+            ureg = pint.UnitRegistry(
+                autoconvert_offset_to_baseunit=True,
+                default_as_delta=False,
+                cache_folder=cache_folder,
+            )
+            _conversions = ConversionTable(ureg)
+            log.info(
+                "Built unit registry in %.2fs (definition cache: %s)",
+                time.perf_counter() - start,
+                cache_folder or "disabled",
+            )
+        return _conversions
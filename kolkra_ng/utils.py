@@ -1,6 +1,8 @@
 """Miscellaneous functions/classes that I couldn't think of a better place to put."""
 
+import time
 from abc import ABC
+from collections import deque
 from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 from typing import Annotated, Any, Generic, ParamSpec, TypeVar
@@ -142,3 +144,30 @@ class Match(KolkraDocument, Generic[DocumentT], ABC):
 # https://stackoverflow.com/a/952952
 def flatten(xss: Iterable[Iterable[T]]) -> Iterable[T]:
     return (x for xs in xss for x in xs)
+
+
+class SlidingWindowCounter:
+    """Counts how many events happened within the last `window` seconds."""
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        self._events: deque[float] = deque()
+
+    def _expire(self, now: float) -> None:
+        while self._events and self._events[0] <= now - self.window:
+            self._events.popleft()
+
+    def hit(self) -> int:
+        """Record an event.
+
+        Returns:
+            int: The number of events in the window, including this one.
+        """
+        now = time.monotonic()
+        self._events.append(now)
+        self._expire(now)
+        return len(self._events)
+
+    def count(self) -> int:
+        self._expire(time.monotonic())
+        return len(self._events)
@@ -5,6 +5,9 @@ from discord.ui import Button, Select, View, button, select
 from kolkra_ng.context import KolkraContext
 from kolkra_ng.embeds import AccessDeniedEmbed
 
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_CHARACTERS_PER_MESSAGE = 6000
+
 
 def group_embeds(embeds: list[Embed]) -> list[list[Embed]]:
     """Splits a list of embeds into groups of a total size of up to 10 embeds or 6,000 characters' worth of content.
@@ -18,14 +21,18 @@ def group_embeds(embeds: list[Embed]) -> list[list[Embed]]:
     """
     groups: list[list[Embed]] = []
     current_group: list[Embed] = []
+    current_size = 0
     for embed in embeds:
-        if (
-            len(current_group) == 10
-            or len(embed) + sum(len(e) for e in current_group) > 6000
+        size = len(embed)  # Walks every field, so only do it once per embed
+        if current_group and (
+            len(current_group) == MAX_EMBEDS_PER_MESSAGE
+            or current_size + size > MAX_CHARACTERS_PER_MESSAGE
         ):
             groups.append(current_group)
             current_group = []
+            current_size = 0
         current_group.append(embed)
+        current_size += size
     groups.append(current_group)
     return groups
 
@@ -0,0 +1,86 @@
+"""Benchmark Kolkra-NG's cold start: from a fresh interpreter to the end of `setup_hook`.
+
+Every run happens in a new process, so nothing is already imported. With a config file, the bot logs in (which runs
+`setup_hook`: loading modules, setting up the database, syncing commands) and exits before connecting to the gateway.
+Without one, `--imports-only` times importing the bot and every module, which needs neither Discord nor MongoDB.
+
+Usage:
+    python scripts/bench_cold_start.py [--runs N] [--config config.toml | --imports-only]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+IMPORTS_ONLY = """
+import importlib
+from pathlib import Path
+
+import kolkra_ng.bot
+
+for path in Path("kolkra_ng/cogs").iterdir():
+    if not path.name.startswith("__"):
+        importlib.import_module("kolkra_ng.cogs." + path.name.removesuffix(".py"))
+"""
+
+SETUP_HOOK = """
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+from kolkra_ng.bot import Kolkra
+from kolkra_ng.config import Config
+
+logging.basicConfig(level=logging.WARNING)
+
+
+async def run() -> None:
+    config = Config.from_files(Path(sys.argv[1]))
+    async with Kolkra(config) as bot:
+        await bot.login(config.bot_token.get_secret_value())  # Runs setup_hook
+
+
+asyncio.run(run())
+"""
+
+
+def run_once(code: str, *args: str) -> float:
+    # main.py is run as a script from the repo root, so extensions are importable as both `cogs.*` and `kolkra_ng.cogs.*`
+    env = os.environ | {
+        "PYTHONPATH": os.pathsep.join([str(ROOT), str(ROOT / "kolkra_ng")])
+    }
+    # Only ever runs this script's own snippets, with the current interpreter
+    command = [sys.executable, "-c", code, *args]
+    start = time.perf_counter()
+    subprocess.run(command, cwd=ROOT, env=env, check=True)  # noqa: S603
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--config", type=Path, default=ROOT / "config.toml")
+    mode.add_argument("--imports-only", action="store_true")
+    args = parser.parse_args()
+
+    if args.imports_only:
+        code, code_args = IMPORTS_ONLY, []
+    else:
+        code, code_args = SETUP_HOOK, [str(args.config.resolve())]
+    times = [run_once(code, *code_args) for _ in range(args.runs)]
+    print(
+        f"{'imports' if args.imports_only else 'setup_hook'} over {args.runs} runs: "
+        f"min {min(times):.2f}s, median {statistics.median(times):.2f}s, max {max(times):.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
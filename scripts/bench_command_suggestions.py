@@ -0,0 +1,74 @@
+"""Microbenchmark for "did you mean" command suggestions as the number of commands grows.
+
+Compares `difflib.get_close_matches` over every name (what command_not_found used to do) with `CommandIndex.suggest`.
+
+Usage:
+    python scripts/bench_command_suggestions.py [--number N]
+"""
+
+import argparse
+import difflib
+import random
+import string
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from discord.ext import commands
+
+from kolkra_ng.command_index import CommandIndex
+
+COMMAND_COUNTS = [100, 1000, 5000]
+
+
+async def callback(ctx: commands.Context) -> None:
+    pass
+
+
+def typo(rng: random.Random, name: str) -> str:
+    i = rng.randrange(len(name))
+    return name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1 :]
+
+
+def bench(rng: random.Random, count: int, number: int) -> None:
+    names = {
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 14)))
+        for _ in range(count)
+    }
+    all_commands = {name: commands.Command(callback, name=name) for name in names}
+    queries = [typo(rng, name) for name in rng.sample(sorted(names), 50)]
+    index = CommandIndex(all_commands)
+
+    def difflib_suggest() -> None:
+        for query in queries:
+            difflib.get_close_matches(query, list(all_commands))
+
+    def index_suggest() -> None:
+        for query in queries:
+            index.suggest(query)
+
+    for name, func in {
+        "difflib": difflib_suggest,
+        "CommandIndex": index_suggest,
+    }.items():
+        per_call = timeit.timeit(func, number=number) / number
+        print(
+            f"{name}, {count} commands: "
+            f"{per_call / len(queries) * 1_000_000:.1f}µs per suggestion"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for count in COMMAND_COUNTS:
+        bench(rng, count, args.number)
+
+
+if __name__ == "__main__":
+    main()
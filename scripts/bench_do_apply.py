@@ -0,0 +1,131 @@
+"""Benchmark ModCog.do_apply against the old strictly sequential order, with stubbed Discord and MongoDB calls.
+
+Every HTTP and database call just sleeps for a fixed latency, so what's measured is how much of that waiting overlaps.
+Neither Discord nor MongoDB is needed.
+
+Usage:
+    python scripts/bench_do_apply.py [--runs N]
+"""
+
+import argparse
+import asyncio
+import itertools
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kolkra_ng.cogs.mod import ModCog, try_dm
+from kolkra_ng.cogs.mod.mod_actions.server_ban import ServerBan
+
+# Rough latencies, in seconds
+DB_LATENCY = 0.005
+CREATE_DM_LATENCY = 0.05
+MESSAGE_LATENCY = 0.06
+BAN_LATENCY = 0.08
+WEBHOOK_LATENCY = 0.07
+
+
+class StubDM:
+    id = 1
+
+    async def send(self, **kwargs: Any) -> None:
+        await asyncio.sleep(MESSAGE_LATENCY)
+
+
+class StubWebhookMessage:
+    def __init__(self) -> None:
+        self.embeds = []
+
+
+class StubWebhooks:
+    async def send(self, destination: Any, **kwargs: Any) -> StubWebhookMessage:
+        await asyncio.sleep(WEBHOOK_LATENCY)
+        return StubWebhookMessage()
+
+
+class StubHTTP:
+    async def ban(self, **kwargs: Any) -> None:
+        await asyncio.sleep(BAN_LATENCY)
+
+
+class StubBot:
+    def __init__(self) -> None:
+        self.config = SimpleNamespace(cogs={})
+        self.webhooks = StubWebhooks()
+        self.http = StubHTTP()
+        self.log_channel = object()
+        self.loop = asyncio.get_running_loop()
+
+    def get_user(self, user_id: int) -> None:
+        return None
+
+    def get_guild(self, guild_id: int) -> None:
+        return None
+
+    async def create_dm(self, user: Any) -> StubDM:
+        await asyncio.sleep(CREATE_DM_LATENCY)
+        return StubDM()
+
+
+class StubBan(ServerBan):
+    @classmethod
+    def get_collection_name(cls) -> str:
+        return "server_bans"
+
+    async def save(self, *args: Any, **kwargs: Any) -> "StubBan":
+        await asyncio.sleep(DB_LATENCY)
+        return self
+
+    async def set(self, *args: Any, **kwargs: Any) -> "StubBan":
+        await asyncio.sleep(DB_LATENCY)
+        return self
+
+
+async def sequential_apply(cog: ModCog, action: ServerBan) -> None:
+    """do_apply as it was before the steps were overlapped."""
+    await action.save()
+    await action.after_create()
+    cog.active_actions.add(action)
+    await try_dm(cog.bot, action.target_id, embed=await action.dm_embed(cog.bot))
+    await action.apply(cog)
+    await cog.bot.webhooks.send(cog.bot.log_channel, embed=await action.log_embed())
+
+
+async def run(runs: int) -> None:
+    cog = ModCog(StubBot())  # pyright: ignore [reportArgumentType]
+    # New target every time, so the DM channel cache doesn't skip create_dm
+    target_ids = itertools.count(1)
+
+    async def time_one(apply: Any) -> float:
+        action = StubBan.model_construct(
+            guild_id=1, issuer_id=2, target_id=next(target_ids), reason="Raiding"
+        )
+        start = time.perf_counter()
+        await apply(action)
+        return time.perf_counter() - start
+
+    for name, apply in {
+        "Sequential": lambda action: sequential_apply(cog, action),
+        "do_apply": cog.do_apply,
+    }.items():
+        times = [await time_one(apply) for _ in range(runs)]
+        print(
+            f"{name}: median {statistics.median(times) * 1000:.1f}ms, "
+            f"max {max(times) * 1000:.1f}ms over {runs} runs"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Microbenchmarks for building embeds.
+
+Usage:
+    python scripts/bench_embeds.py [--number N]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from discord import Embed
+
+from kolkra_ng.embeds import ErrorEmbed, InfoEmbed, OkEmbed, SplitEmbed
+from kolkra_ng.views.pager import group_embeds
+
+
+def split_embed_1k_fields() -> None:
+    split_embed = SplitEmbed.from_single(
+        InfoEmbed(title="Benchmark", description="A line of text\n" * 500)
+    )
+    for i in range(1000):
+        split_embed.add_field(name=f"Field {i}", value="Some value " * 5)
+    split_embed.embeds()
+
+
+def status_embeds() -> None:
+    OkEmbed(description="It worked").to_dict()
+    ErrorEmbed(description="It didn't work").to_dict()
+
+
+MANY_EMBEDS = [
+    Embed(title=f"Embed {i}", description="x" * (i % 700)).add_field(
+        name="Field", value="y" * (i % 300)
+    )
+    for i in range(5000)
+]
+
+
+def group_5k_embeds() -> None:
+    group_embeds(MANY_EMBEDS)
+
+
+BENCHMARKS = {
+    "SplitEmbed, 1k fields": split_embed_1k_fields,
+    "group_embeds, 5k embeds": group_5k_embeds,
+    "Status embeds + to_dict, x2": status_embeds,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+    for name, func in BENCHMARKS.items():
+        per_call = timeit.timeit(func, number=args.number) / args.number
+        print(f"{name}: {per_call * 1_000_000:.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Microbenchmark for looking up members' staff levels.
+
+Compares the original lookup (check every configured level, take the highest) with `Kolkra.get_staff_level_for`,
+both on a cold cache and with the per-member memo warm. Members are stand-ins that look roles up the same way
+`discord.Member.get_role` does, so neither Discord nor a config file is needed.
+
+Usage:
+    python scripts/bench_staff_levels.py [--number N] [--members N] [--roles N]
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from discord.utils import SnowflakeList
+
+from kolkra_ng.bot import Kolkra
+from kolkra_ng.enums.staff_level import StaffLevel
+
+GUILD = SimpleNamespace(id=1, get_role=lambda role_id: role_id)
+STAFF_ROLES = {level: 1000 + level.value for level in StaffLevel}
+
+
+class StubMember:
+    def __init__(self, member_id: int, role_ids: list[int]) -> None:
+        self.id = member_id
+        self.guild = GUILD
+        self._roles = SnowflakeList(role_ids)
+
+    def get_role(self, role_id: int) -> int | None:
+        # Same as discord.Member.get_role
+        return self.guild.get_role(role_id) if self._roles.has(role_id) else None
+
+
+def original_lookup(user: StubMember) -> StaffLevel | None:
+    """get_staff_level_for as it was before the role index and memo."""
+    if not (
+        levels := [
+            level for level, role_id in STAFF_ROLES.items() if user.get_role(role_id)
+        ]
+    ):
+        return None
+    return max(levels)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--roles", type=int, default=100, help="Roles per member")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    members = [
+        StubMember(
+            i,
+            rng.sample(range(2000, 10_000), args.roles)
+            # Give about one in ten members a staff role
+            + ([rng.choice(list(STAFF_ROLES.values()))] if i % 10 == 0 else []),
+        )
+        for i in range(args.members)
+    ]
+    bot = SimpleNamespace(
+        staff_role_levels={
+            role_id: level
+            for level, role_id in sorted(STAFF_ROLES.items(), reverse=True)
+        },
+        _staff_level_cache={},
+    )
+
+    # Called unbound, with the stand-ins in place of the bot and real members
+    lookup: Any = Kolkra.get_staff_level_for
+
+    def indexed(cold: bool) -> None:
+        if cold:
+            bot._staff_level_cache.clear()
+        for member in members:
+            lookup(bot, member)
+
+    if any(original_lookup(m) != lookup(bot, m) for m in members):
+        print("The lookups disagree!")
+        sys.exit(1)
+    for name, func in {
+        "Original": lambda: [original_lookup(m) for m in members],
+        "Role index, cold memo": lambda: indexed(cold=True),
+        "Role index, warm memo": lambda: indexed(cold=False),
+    }.items():
+        per_call = timeit.timeit(func, number=args.number) / args.number
+        print(
+            f"{name}: {per_call / args.members * 1_000_000:.2f}µs per member "
+            f"({args.roles} roles each)"
+        )
+
+
+if __name__ == "__main__":
+    main()
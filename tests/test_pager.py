@@ -0,0 +1,98 @@
+import random
+
+import pytest
+from discord import Embed
+
+from kolkra_ng.views.pager import (
+    MAX_CHARACTERS_PER_MESSAGE,
+    MAX_EMBEDS_PER_MESSAGE,
+    group_embeds,
+)
+
+
+def group_embeds_reference(embeds: list[Embed]) -> list[list[Embed]]:
+    """group_embeds as it was before it kept a running total, re-summing the current group for every embed."""
+    groups: list[list[Embed]] = []
+    current_group: list[Embed] = []
+    for embed in embeds:
+        if (
+            len(current_group) == 10
+            or len(embed) + sum(len(e) for e in current_group) > 6000
+        ):
+            groups.append(current_group)
+            current_group = []
+        current_group.append(embed)
+    groups.append(current_group)
+    return groups
+
+
+def embed_of_size(size: int) -> Embed:
+    # Split between the title (max. 256 characters) and the description, so both count towards the size
+    title_length = min(size, 256)
+    return Embed(title="t" * title_length, description="d" * (size - title_length))
+
+
+def random_embeds(rng: random.Random, count: int, max_size: int) -> list[Embed]:
+    return [embed_of_size(rng.randint(0, max_size)) for _ in range(count)]
+
+
+def sizes(groups: list[list[Embed]]) -> list[list[int]]:
+    return [[len(embed) for embed in group] for group in groups]
+
+
+@pytest.mark.parametrize("max_size", [50, 600, 3000, 6000])
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_reference(seed: int, max_size: int) -> None:
+    embeds = random_embeds(random.Random(seed), 100, max_size)
+    groups = group_embeds(embeds)
+    assert groups == group_embeds_reference(embeds)
+    assert [embed for group in groups for embed in group] == embeds
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_groups_within_limits(seed: int) -> None:
+    for group in group_embeds(random_embeds(random.Random(seed), 100, 6000)):
+        assert 0 < len(group) <= MAX_EMBEDS_PER_MESSAGE
+        assert sum(len(embed) for embed in group) <= MAX_CHARACTERS_PER_MESSAGE
+
+
+def test_exactly_6000_characters_fit_in_one_group() -> None:
+    embeds = [embed_of_size(2000) for _ in range(3)]
+    assert sizes(group_embeds(embeds)) == [[2000, 2000, 2000]]
+    assert group_embeds(embeds) == group_embeds_reference(embeds)
+
+
+def test_one_character_over_6000_starts_a_new_group() -> None:
+    embeds = [embed_of_size(2000), embed_of_size(2000), embed_of_size(2001)]
+    assert sizes(group_embeds(embeds)) == [[2000, 2000], [2001]]
+    assert group_embeds(embeds) == group_embeds_reference(embeds)
+
+
+def test_single_6000_character_embeds() -> None:
+    embeds = [embed_of_size(6000) for _ in range(3)]
+    assert sizes(group_embeds(embeds)) == [[6000], [6000], [6000]]
+    assert group_embeds(embeds) == group_embeds_reference(embeds)
+
+
+def test_exactly_10_embeds_fit_in_one_group() -> None:
+    embeds = [embed_of_size(1) for _ in range(10)]
+    assert sizes(group_embeds(embeds)) == [[1] * 10]
+    assert group_embeds(embeds) == group_embeds_reference(embeds)
+
+
+def test_11th_embed_starts_a_new_group() -> None:
+    embeds = [embed_of_size(0) for _ in range(21)]
+    assert sizes(group_embeds(embeds)) == [[0] * 10, [0] * 10, [0]]
+    assert group_embeds(embeds) == group_embeds_reference(embeds)
+
+
+def test_empty() -> None:
+    assert group_embeds([]) == group_embeds_reference([]) == [[]]
+
+
+def test_oversized_first_embed_gets_no_empty_group() -> None:
+    # The only case where the two differ: the old version put an empty group in front of an embed that's over
+    # the limit by itself
+    embeds = [embed_of_size(6001), embed_of_size(10)]
+    assert sizes(group_embeds(embeds)) == [[6001], [10]]
+    assert sizes(group_embeds_reference(embeds)) == [[], [6001], [10]]